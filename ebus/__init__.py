@@ -10,16 +10,29 @@ __url__ = "https://github.com/c0fec0de/ebus"
 
 from . import cli  # noqa
 from . import types
+from .batchdecoder import BatchDecoder  # noqa
 from .circuitmap import CircuitMap  # noqa
 from .connection import CommandError  # noqa
 from .connection import Connection  # noqa
+from .connectionpool import ConnectionPool  # noqa
 from .ebus import Ebus  # noqa
+from .memo import Memo  # noqa
+from .msg import BrokenMsg  # noqa
 from .msg import Error  # noqa
 from .msg import Field  # noqa
+from .msg import LazyField  # noqa
+from .msg import LazyMsg  # noqa
 from .msg import Msg  # noqa
+from .msg import MsgFilter  # noqa
+from .msgcache import MsgCache  # noqa
 from .msgdecoder import MsgDecoder  # noqa
 from .msgdecoder import UnknownMsgError  # noqa
 from .msgdef import FieldDef  # noqa
 from .msgdef import MsgDef  # noqa
 from .msgdefdecoder import decode_msgdef  # noqa
+from .msgdefdecoder import decode_msgdefs  # noqa
+from .msgdefs import FrozenMsgDefs  # noqa
 from .msgdefs import MsgDefs  # noqa
+from .msgdefscache import MsgDefsCache  # noqa
+from .ratelimiter import RateLimiter  # noqa
+from .singleflight import SingleFlight  # noqa
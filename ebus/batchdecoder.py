@@ -0,0 +1,114 @@
+import collections
+import itertools
+
+from .msgdecoder import MsgDecoder
+from .msgdecoder import UnknownMsgError
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+Batch = collections.namedtuple("Batch", "columns size skipped")
+Column = collections.namedtuple("Column", "fielddef timestamps values valid")
+
+_MISSING = object()
+
+
+class BatchDecoder:
+    def __init__(self, msgdefs, memosize=None):
+        """
+        Columnar Batch Decoder for Recorded `listen` Output.
+
+        Instead of one :any:`Msg` per line, a chunk of lines is decoded into one :any:`Column`
+        per numeric field (see :any:`Type.numeric`) with preallocated NumPy arrays:
+        `timestamps` (float), `values` (float, NaN if invalid) and `valid` (bool).
+        Columns of the same message share their `timestamps` array.
+
+        Lines are parsed and values are decoded by :any:`MsgDecoder`.
+
+        Requires `numpy` (`pip install ebus[numpy]`).
+
+        Args:
+            msgdefs (MsgDefs): Message Definitions
+
+        Keyword Args:
+            memosize (int): Maximum number of memoized values per type (see :any:`MsgDecoder`).
+
+        Raises:
+            ImportError: if `numpy` is not installed.
+        """
+        if numpy is None:
+            raise ImportError("BatchDecoder requires numpy (pip install ebus[numpy])")
+        self.msgdecoder = MsgDecoder(msgdefs, memosize=memosize)
+
+    @property
+    def msgdefs(self):
+        """Message Definitions."""
+        return self.msgdecoder.msgdefs
+
+    @msgdefs.setter
+    def msgdefs(self, msgdefs):
+        self.msgdecoder.msgdefs = msgdefs
+
+    def decode(self, lines, timestamps=None):
+        """
+        Decode `lines` and return :any:`Batch` with columns by field identifier.
+
+        Lines of unknown messages, without data or with errors are skipped and counted.
+
+        Keyword Args:
+            timestamps: One timestamp in seconds per line. The line number within `lines` by default.
+
+        Raises:
+            ValueError: if the number of `timestamps` differs from the number of `lines`.
+        """
+        msgdecoder = self.msgdecoder
+        if timestamps is None:
+            pairs = zip(lines, itertools.count())
+        else:
+            pairs = itertools.zip_longest(lines, timestamps, fillvalue=_MISSING)
+        # group by message, to allocate every column just once
+        rows = collections.defaultdict(list)
+        size = skipped = 0
+        for line, timestamp in pairs:
+            if line is _MISSING or timestamp is _MISSING:
+                raise ValueError("Number of lines and timestamps differ")
+            size += 1
+            try:
+                msgdef, valuestr = msgdecoder.parse_line(line)
+            except (ValueError, UnknownMsgError):
+                valuestr = None
+            if valuestr is None:
+                skipped += 1
+            else:
+                rows[msgdef].append((timestamp, valuestr))
+        columns = {}
+        for msgdef, msgrows in rows.items():
+            columns.update(_decode_rows(msgdef, msgrows, msgdecoder.get_decoder))
+        return Batch(columns, size, skipped)
+
+
+def _decode_rows(msgdef, rows, getdecoder):
+    """Decode `rows` of `msgdef` and return the columns by field identifier."""
+    num = len(rows)
+    timestamps = numpy.fromiter((timestamp for timestamp, _ in rows), dtype=float, count=num)
+    plan = []
+    columns = {}
+    for fielddef in msgdef.fields:
+        if fielddef.idx is not None and fielddef.type_.numeric:
+            values = numpy.full(num, numpy.nan)
+            valid = numpy.zeros(num, dtype=bool)
+            plan.append((fielddef.idx, getdecoder(fielddef.type_), values, valid))
+            columns[f"{msgdef.ident}/{fielddef.name}"] = Column(fielddef, timestamps, values, valid)
+    if plan:
+        for row, (_, valuestr) in enumerate(rows):
+            valuestrs = valuestr.split(";")
+            cnt = len(valuestrs)
+            for idx, decoder, values, valid in plan:
+                if idx < cnt:
+                    value = decoder(valuestrs[idx].strip())
+                    if value is not None:
+                        values[row] = value
+                        valid[row] = True
+    return columns
@@ -9,6 +9,7 @@ from . import cmd
 from . import listen
 from . import ls
 from . import observe
+from . import poll
 from . import read
 from . import state
 from . import write
@@ -27,6 +28,7 @@ def argvhandler(argv):
     listen.parse_args(subparsers)
     ls.parse_args(subparsers)
     observe.parse_args(subparsers)
+    poll.parse_args(subparsers)
     read.parse_args(subparsers)
     state.parse_args(subparsers)
     write.parse_args(subparsers)
@@ -1,3 +1,4 @@
+import concurrent.futures
 import sys
 
 import ebus
@@ -8,6 +9,9 @@ def add_ebus_args(parser):
     parser.add_argument("--host", "-H", default="127.0.0.1", help="EBUSD address. Default is '172.0.0.1'.")
     parser.add_argument("--port", "-P", default=8888, type=int, help="EBUSD port. Default is 8888.")
     parser.add_argument("--timeout", "-T", default=10, type=int, help="EBUSD connection timeout. Default is 10.")
+    parser.add_argument(
+        "--connections", "-C", default=1, type=int, help="Number of parallel EBUSD request connections. Default is 1."
+    )
 
 
 def add_msgdef_args(parser):
@@ -23,12 +27,27 @@ def add_msgdef_args(parser):
             "Specify this option, if EBUSD was started within the last minutes."
         ),
     )
+    parser.add_argument("--cachedir", help="Directory of the message definition cache. Default is '~/.cache/ebus'.")
+    parser.add_argument(
+        "--nocache", default=False, action="store_true", help="Do not use the message definition cache."
+    )
+    parser.add_argument(
+        "--jobs", "-j", default=1, type=int, help="Number of processes decoding message definitions. Default is 1."
+    )
 
 
 def add_read_args(parser, ttl=None):
     """Read Arguments."""
     parser.add_argument("--prio", "-p", default=False, action="store_true", help="Set poll priority")
     parser.add_argument("--ttl", "-t", default=ttl, type=int, help="Maximum age of value in seconds")
+    add_depth_arg(parser)
+
+
+def add_depth_arg(parser):
+    """Add pipeline depth option."""
+    parser.add_argument(
+        "--depth", "-d", default=1, type=int, help="Number of reads pipelined on one connection. Default is 1."
+    )
 
 
 def add_patterns_arg(parser, opt=False):
@@ -51,7 +70,7 @@ def disable_stdout_buffering():
 
 def create_ebus(args):
     """Create :any:`Ebus` instance with parameters from `args`."""
-    return ebus.Ebus(host=args.host, port=args.port, timeout=args.timeout)
+    return ebus.Ebus(host=args.host, port=args.port, timeout=args.timeout, poolsize=args.connections)
 
 
 async def load_msgdefs(e, args):
@@ -63,12 +82,22 @@ async def load_msgdefs(e, args):
         print(" DONE.")
 
     print("Loading Message Definitions ... ", end="")
-    await e.load_msgdefs()
+    cache = ebus.MsgDefsCache(args.cachedir) if not args.nocache else None
+    if args.jobs > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            await e.load_msgdefs(cache=cache, executor=executor)
+    else:
+        await e.load_msgdefs(cache=cache)
     print(f"{e.msgdefs.summary()} DONE.")
 
 
-def format_field(field):
-    """Format Field Value."""
+def format_field(msg, field):
+    """Format Field Value of `field` within `msg`."""
     comment = field.fielddef.comment
     details = f" [{comment}]" if comment else ""
-    return f"{field.ident:<40s} {field.fielddef.msgdef.type_} {field.unitvalue}{details}"
+    return f"{field.ident:<40s} {msg.msgdef.type_} {field.unitvalue}{details}"
+
+
+def format_error(brokenmsg):
+    """Format Error of Broken Message."""
+    return f"{brokenmsg.ident:<40s} {brokenmsg.msgdef.type_} ERROR: {brokenmsg.error}"
@@ -15,6 +15,10 @@ def parse_args(subparsers):
     add_ebus_args(parser)
     add_msgdef_args(parser)
     add_patterns_arg(parser, opt=True)
+    parser.add_argument("--dedup", "-u", default=False, action="store_true", help="Skip messages with unchanged value.")
+    parser.add_argument(
+        "--heartbeat", "-b", type=int, help="With --dedup, print unchanged messages again after this many seconds."
+    )
     parser.set_defaults(main=_main)
 
 
@@ -25,6 +29,6 @@ async def _main(args):
     msgdefs = e.msgdefs.resolve(args.patterns.split(";"))
     print(f"Listening to {msgdefs.summary()}")
     if msgdefs:
-        async for msg in e.listen(msgdefs=msgdefs):
+        async for msg in e.listen(msgdefs=msgdefs, dedup=args.dedup, heartbeat=args.heartbeat):
             for field in msg.fields:
-                print(format_field(field))
+                print(format_field(msg, field))
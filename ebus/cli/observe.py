@@ -30,6 +30,6 @@ async def _main(args):
     await load_msgdefs(e, args)
     msgdefs = e.msgdefs.resolve(args.patterns.split(";"))
     print(f"Observing {msgdefs.summary()}")
-    async for msg in e.observe(msgdefs=msgdefs, prio=args.prio, ttl=args.ttl):
+    async for msg in e.observe(msgdefs=msgdefs, prio=args.prio, ttl=args.ttl, depth=args.depth):
         for field in msg.fields:
-            print(format_field(field))
+            print(format_field(msg, field))
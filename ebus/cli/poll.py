@@ -0,0 +1,44 @@
+from ..msg import BrokenMsg
+from .common import add_depth_arg
+from .common import add_ebus_args
+from .common import add_msgdef_args
+from .common import add_patterns_arg
+from .common import create_ebus
+from .common import disable_stdout_buffering
+from .common import format_error
+from .common import format_field
+from .common import load_msgdefs
+
+
+def parse_args(subparsers):
+    """Parse Arguments."""
+    parser = subparsers.add_parser(
+        "poll", help="Read values from the bus periodically according to their priority, decode and print"
+    )
+    add_ebus_args(parser)
+    add_msgdef_args(parser)
+    parser.add_argument("--prio", "-p", default=False, action="store_true", help="Set poll priority")
+    parser.add_argument(
+        "--interval",
+        "-i",
+        default=60,
+        type=int,
+        help="Poll interval in seconds of messages with priority 1. Priority N is polled every N intervals.",
+    )
+    add_depth_arg(parser)
+    add_patterns_arg(parser, opt=True)
+    parser.set_defaults(main=_main)
+
+
+async def _main(args):
+    disable_stdout_buffering()
+    e = create_ebus(args)
+    await load_msgdefs(e, args)
+    msgdefs = e.msgdefs.resolve(args.patterns.split(";"), filter_=lambda msgdef: msgdef.read)
+    print(f"Polling {msgdefs.summary()}")
+    async for msg in e.poll(msgdefs, interval=args.interval, prio=args.prio, depth=args.depth):
+        if isinstance(msg, BrokenMsg):
+            print(format_error(msg))
+        else:
+            for field in msg.fields:
+                print(format_field(msg, field))
@@ -1,9 +1,11 @@
+from ..msg import BrokenMsg
 from .common import add_ebus_args
 from .common import add_msgdef_args
 from .common import add_patterns_arg
 from .common import add_read_args
 from .common import create_ebus
 from .common import disable_stdout_buffering
+from .common import format_error
 from .common import format_field
 from .common import load_msgdefs
 
@@ -24,9 +26,9 @@ async def _main(args):
     await load_msgdefs(e, args)
     msgdefs = e.msgdefs.resolve(args.patterns.split(";"), filter_=lambda msgdef: msgdef.read or msgdef.update)
     print(f"Reading to {msgdefs.summary()}")
-    for msgdef in msgdefs:
-        if msgdef.read:
-            msg = await e.read(msgdef, prio=args.prio, ttl=args.ttl)
-            if msg:
-                for field in msg.fields:
-                    print(format_field(field))
+    async for msg in e.read_many(msgdefs, prio=args.prio, ttl=args.ttl, depth=args.depth):
+        if isinstance(msg, BrokenMsg):
+            print(format_error(msg))
+        else:
+            for field in msg.fields:
+                print(format_field(msg, field))
@@ -128,6 +128,31 @@ class Connection:
             if not line and not infinite:
                 break
 
+    async def pipeline(self, messages, check=False):
+        """
+        Send all `messages` at once and receive their responses in order.
+
+        Yields one tuple of lines per message, including the terminating empty line.
+        If `check` is set, a failed command yields its :any:`CommandError` instead,
+        so that the responses of the remaining messages stay aligned.
+
+        Raises:
+            IOError: If connection is broken or cannot be established (`autoconnect==True`)
+            ConnectionError: If not connected (`autoconnect==False`)
+        """
+        messages = tuple(messages)
+        _LOGGER.debug(f"pipeline({messages!r})")
+        await self._ensure_connection()
+        self._writer.write("".join(f"{message}\n" for message in messages).encode())
+        await self._timedout(self._writer.drain())
+        for _ in messages:
+            try:
+                lines = tuple([line async for line in self.readlines(check=check)])
+            except CommandError as e:
+                yield e
+            else:
+                yield lines
+
     async def _readline(self):
         line = await self._reader.readline()
         return line.decode("utf-8").rstrip()
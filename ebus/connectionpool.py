@@ -0,0 +1,114 @@
+import asyncio
+import collections
+import contextlib
+import heapq
+import itertools
+import logging
+
+from .connection import Connection
+from .util import repr_
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    def __init__(self, host="127.0.0.1", port=8888, size=1, timeout=None):
+        """
+        Pool of auto-connecting :any:`Connection` instances.
+
+        Urgent requests (i.e. writes) get the next idle connection before all other waiting requests.
+
+        Keyword Args:
+            host (str): Hostname or IP
+            port (int): Port
+            size (int): Number of connections
+            timeout (int): Connection Timeout
+        """
+        if size < 1:
+            raise ValueError(f"Invalid pool size {size!r}")
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._connections = tuple(
+            Connection(host=host, port=port, autoconnect=True, timeout=timeout) for _ in range(size)
+        )
+        self._idle = collections.deque(self._connections)
+        self._waiters = []
+        self._seq = itertools.count()
+
+    def __repr__(self):
+        return repr_(
+            self,
+            kwargs=(
+                ("host", self.host, "127.0.0.1"),
+                ("port", self.port, 8888),
+                ("size", self.size, 1),
+                ("timeout", self.timeout, None),
+            ),
+        )
+
+    @property
+    def host(self):
+        """Host."""
+        return self._host
+
+    @property
+    def port(self):
+        """Port."""
+        return self._port
+
+    @property
+    def size(self):
+        """Number of Connections."""
+        return len(self._connections)
+
+    @property
+    def timeout(self):
+        """Connection Timeout."""
+        return self._timeout
+
+    @property
+    def connections(self):
+        """All Connections."""
+        return self._connections
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, urgent=False):
+        """
+        Acquire an idle connection for exclusive use.
+
+        Waits until one connection becomes idle, `urgent` before all other waiting requests.
+        The connection returns to the pool on exit.
+        """
+        if self._idle and not self._waiters:
+            connection = self._idle.popleft()
+        else:
+            future = asyncio.get_event_loop().create_future()
+            heapq.heappush(self._waiters, (0 if urgent else 1, next(self._seq), future))
+            try:
+                connection = await future
+            except asyncio.CancelledError:
+                # the connection might have been handed over already
+                if future.done() and not future.cancelled():
+                    self._release(future.result())
+                raise
+        _LOGGER.debug(f"acquire(urgent={urgent!r}) = {connection!r}")
+        try:
+            yield connection
+        finally:
+            self._release(connection)
+
+    async def disconnect(self):
+        """Disconnect all connections."""
+        for connection in self._connections:
+            await connection.disconnect()
+
+    def _release(self, connection):
+        # hand the connection over to the first waiter, cancelled waiters do not take it
+        waiters = self._waiters
+        while waiters:
+            _, _, future = heapq.heappop(waiters)
+            if not future.done():
+                future.set_result(connection)
+                return
+        self._idle.append(connection)
@@ -1,32 +1,63 @@
 import asyncio
 import collections
+import heapq
+import itertools
 import logging
+import re
+import time
 
 from .connection import CommandError
 from .connection import Connection
 from .connection import ConnectionTimeout
+from .connectionpool import ConnectionPool
+from .msg import BrokenMsg
+from .msg import MsgFilter
 from .msg import filter_msg
 from .msgdecoder import MsgDecoder
 from .msgdecoder import UnknownMsgError
-from .msgdefdecoder import decode_msgdef
+from .msgdefdecoder import decode_msgdefs
 from .msgdefs import MsgDefs
+from .msgdefscache import fingerprint
+from .singleflight import SingleFlight
 from .util import repr_
 
 _LOGGER = logging.getLogger(__name__)
 _CMD_FINDMSGDEFS = "find -a -F type,circuit,name,fields"
+_RE_INFO_MESSAGES = re.compile(r"\Amessages: (\d+)\Z")
+_RE_INFO_SLAVE = re.compile(r"\Aaddress [0-9a-fA-F]{2}: slave")
 
 
 class Ebus:
-    def __init__(self, host, port, timeout=None, scanwaitinterval=3, msgdefs=None):
+    def __init__(
+        self, host, port, timeout=None, scanwaitinterval=3, msgdefs=None, poolsize=1, cache=None, ratelimiter=None
+    ):
         """
         Pythonic EBUS Representation.
 
         This instance connects to an EBUSD instance and allows to read, write or monitor.
+
+        Infinite commands like `listen` use the dedicated :any:`connection`.
+        All other commands are served by a :any:`ConnectionPool` of `poolsize` connections,
+        so that reads and writes do not wait for a running `listen`. Writes get the next idle connection.
+        Identical concurrent reads share one request via :any:`SingleFlight`.
+
+        An optional :any:`MsgCache` `cache` collects all received messages and
+        answers reads with `ttl`, if the cached message is not older than `ttl` seconds.
+
+        An optional :any:`RateLimiter` `ratelimiter` limits the reads and writes per circuit,
+        whereby writes are preferred.
         """
         self.connection = Connection(host=host, port=port, autoconnect=True, timeout=timeout)
+        self.pool = ConnectionPool(host=host, port=port, size=poolsize, timeout=timeout)
+        self.singleflight = SingleFlight()
+        self.cache = cache
+        self.ratelimiter = ratelimiter
         self.scanwaitinterval = scanwaitinterval
         self._msgdefs = msgdefs
         self.msgdecoder = MsgDecoder(msgdefs or MsgDefs())
+        self._msgdeflines = {}
+        # number of writes per message, to detect reads which raced with a write
+        self._writes = collections.Counter()
         _LOGGER.info(f"{self}")
 
     def __repr__(self):
@@ -37,6 +68,9 @@ class Ebus:
                 ("timeout", self.timeout, None),
                 ("scanwaitinterval", self.scanwaitinterval, 3),
                 ("msgdefs", self._msgdefs, None),
+                ("poolsize", self.poolsize, 1),
+                ("cache", self.cache, None),
+                ("ratelimiter", self.ratelimiter, None),
             ),
         )
 
@@ -55,6 +89,11 @@ class Ebus:
         """Timeout."""
         return self.connection.timeout
 
+    @property
+    def poolsize(self):
+        """Number of Request Connections."""
+        return self.pool.size
+
     @property
     def msgdefs(self):
         """Message Defintions."""
@@ -66,41 +105,96 @@ class Ebus:
 
     def __copy__(self):
         return Ebus(
-            self.host, self.port, timeout=self.timeout, scanwaitinterval=self.scanwaitinterval, msgdefs=self.msgdefs
+            self.host,
+            self.port,
+            timeout=self.timeout,
+            scanwaitinterval=self.scanwaitinterval,
+            msgdefs=self.msgdefs,
+            poolsize=self.poolsize,
+            cache=self.cache,
+            ratelimiter=self.ratelimiter,
         )
 
+    async def disconnect(self):
+        """Disconnect all connections."""
+        await self.connection.disconnect()
+        await self.pool.disconnect()
+
     async def wait_scancompleted(self):
-        """Wait until scan is completed."""
+        """
+        Wait until scan is completed and yield the number of known messages meanwhile.
+
+        The scan state is taken from the EBUSD `info` command:
+        The scan is completed, if the number of messages did not change since the last check
+        and all slaves are scanned. Slaves which never answer the scan are ignored,
+        if the number of messages did not change for the last 3 checks.
+        The full message definitions are just counted, if EBUSD does not report the number of messages.
+        """
         cnts = []
         while True:
-            cnt = sum([1 async for line in self._request(_CMD_FINDMSGDEFS)])
+            cnt, pending = await self._get_scanstate()
+            if cnt is None:
+                cnt = sum([1 async for line in self._request(_CMD_FINDMSGDEFS)])
+                pending = None
             cnts.append(cnt)
-            if len(cnts) < 4 or cnts[-4] != cnts[-3] or cnts[-3] != cnts[-2] or cnts[-2] != cnts[-1]:
-                yield cnt
-                await asyncio.sleep(self.scanwaitinterval)
-            else:
+            if len(cnts) >= 2 and cnts[-2] == cnt and pending == 0:
+                break
+            if len(cnts) >= 4 and len(set(cnts[-4:])) == 1:
                 break
+            yield cnt
+            await asyncio.sleep(self.scanwaitinterval)
 
-    async def load_msgdefs(self):
+    async def load_msgdefs(self, cache=None, executor=None, chunksize=256):
         """
         Load Message Definitions from EBUSD.
 
+        Subsequent calls just decode lines which changed since the last call.
+        The result is published as new :any:`FrozenMsgDefs` snapshot to :any:`msgdefs` at once,
+        so concurrent readers either see the previous or the new message definitions.
+
+        With an `executor` new lines are decoded in chunks of `chunksize` lines in parallel,
+        without blocking the event loop. Up to `chunksize` new lines are still decoded in-process.
+        The result does not depend on the chunking.
+
         Keyword Args:
-            scanwait(bool): Wait for EBUSD scan to complete
+            cache (MsgDefsCache): Take decoded message definitions from `cache`, if they are still up-to-date.
+            executor (concurrent.futures.Executor): Thread or process pool for decoding.
+            chunksize (int): Number of lines decoded by one executor job.
+
+        Returns:
+            MsgDefsDiff: added, removed and changed message definitions.
         """
-        _LOGGER.info("load_msgdefs()")
-        self.msgdefs.clear()
-        msgdefs = []
-        async for line in self._request(_CMD_FINDMSGDEFS):
-            if line:
-                try:
-                    msgdef = decode_msgdef(line)
-                    if not msgdef.circuit.startswith("scan"):
-                        msgdefs.append(msgdef)
-                except ValueError as e:
-                    _LOGGER.warn(f"Cannot decode message definition ({e})")
-        for msgdef in sorted(msgdefs, key=lambda msgdef: (msgdef.circuit, msgdef.name)):
-            self.msgdefs.add(msgdef)
+        _LOGGER.info(f"load_msgdefs(cache={cache!r}, executor={executor!r}, chunksize={chunksize!r})")
+        lines = [line async for line in self._request(_CMD_FINDMSGDEFS) if line]
+        decoded = None
+        if cache is not None:
+            fingerprint_ = fingerprint(lines)
+            decoded = cache.load(self.host, self.port, fingerprint_)
+        if decoded is None:
+            known = self._msgdeflines
+            newlines = [line for line in lines if line not in known]
+            new = dict(zip(newlines, await _decode_msgdefs(newlines, executor, chunksize)))
+            decoded = {}
+            for line in lines:
+                msgdef = known[line] if line in known else new[line]
+                if msgdef is not None and msgdef.circuit.startswith("scan"):
+                    msgdef = None
+                decoded[line] = msgdef
+            if cache is not None:
+                cache.save(self.host, self.port, fingerprint_, decoded)
+        self._msgdeflines = decoded
+        msgdefs = MsgDefs()
+        for msgdef in sorted(
+            (msgdef for msgdef in decoded.values() if msgdef is not None),
+            key=lambda msgdef: (msgdef.circuit, msgdef.name),
+        ):
+            msgdefs.add(msgdef)
+        # copy-on-write: the published snapshot and its message and field definitions stay untouched
+        updated = self.msgdefs.copy()
+        diff = updated.update(msgdefs)
+        self.msgdefs = updated.freeze()
+        _LOGGER.info(f"load_msgdefs: {len(diff.added)} added, {len(diff.removed)} removed, {len(diff.changed)} changed")
+        return diff
 
     async def read(self, msgdef, prio=False, ttl=None):
         """
@@ -110,45 +204,130 @@ class Ebus:
             ValueError: on decoder error
         """
         _LOGGER.info(f"read({msgdef!r}, prio={prio!r}, ttl={ttl!r})")
-        p = msgdef.prio if prio else None
         try:
-            lines = tuple([line async for line in self._request("read", msgdef.name, c=msgdef.circuit, p=p, m=ttl)])
+            return await self._read(msgdef, prio=prio, ttl=ttl)
         except CommandError as e:
             _LOGGER.warn(f"{msgdef.ident}: {e!r}")
-        else:
-            return self.msgdecoder.decode_value(msgdef, lines[0])
+
+    async def read_many(self, msgdefs, prio=False, ttl=None, concurrency=None, depth=1):
+        """
+        Read all readable messages of `msgdefs` concurrently.
+
+        Messages are yielded in the order of completion.
+        A failed read yields a :any:`BrokenMsg` with the :any:`CommandError`.
+
+        Keyword Args:
+            prio (bool): Set poll priority
+            ttl (int): Maximum age of value in seconds
+            concurrency (int): Maximum number of parallel reads. Default is :any:`poolsize`.
+            depth (int): Number of reads pipelined on one connection.
+        """
+        _LOGGER.info(
+            f"read_many({msgdefs!r}, prio={prio!r}, ttl={ttl!r}, concurrency={concurrency!r}, depth={depth!r})"
+        )
+        async for msg in self._read_many(msgdefs, prio=prio, ttl=ttl, concurrency=concurrency, depth=depth):
+            yield msg
+
+    async def _read_many(self, msgdefs, prio=False, ttl=None, concurrency=None, depth=1, cached=True):
+        """Read readable messages of `msgdefs` like :any:`read_many`, without :any:`cache` lookup if not `cached`."""
+        semaphore = asyncio.Semaphore(concurrency or self.poolsize)
+
+        async def read(chunk):
+            async with semaphore:
+                if len(chunk) > 1:
+                    return await self._read_pipelined(chunk, prio=prio, ttl=ttl)
+                try:
+                    return [await self._read(chunk[0], prio=prio, ttl=ttl, cached=cached)]
+                except CommandError as e:
+                    return [BrokenMsg(chunk[0], e)]
+
+        readmsgdefs = []
+        for msgdef in msgdefs:
+            if msgdef.read:
+                msg = self._lookup(msgdef, ttl) if cached else None
+                if msg:
+                    yield msg
+                else:
+                    readmsgdefs.append(msgdef)
+        chunks = [readmsgdefs[idx : idx + depth] for idx in range(0, len(readmsgdefs), depth)]
+        tasks = [asyncio.ensure_future(read(chunk)) for chunk in chunks]
+        try:
+            for task in asyncio.as_completed(tasks):
+                for msg in await task:
+                    if msg:
+                        yield msg
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def write(self, msgdef, value, ttl=None):
-        """Write Message."""
+        """
+        Write Message.
+
+        A cached value of the message is dropped on success, as it is outdated.
+        """
         _LOGGER.info(f"write({msgdef!r}, value={value!r}, ttl={ttl!r})")
         if not msgdef.write:
             raise ValueError(f"Message is not writeable '{msgdef}'")
         fullmsgdef = self.msgdefs.get(msgdef.circuit, msgdef.name)
-        if fullmsgdef != msgdef:
+        if fullmsgdef == msgdef:
+            values = ["-" if value is None else str(value)]
+        else:
             if not msgdef.read:
                 raise ValueError(f"Message is not read-modify-writable '{msgdef}'")
             # read actual values
-            readline = tuple([line async for line in self._request("read", msgdef.name, c=msgdef.circuit, m=ttl)])[0]
+            await self._throttle(msgdef.circuit, urgent=True)
+            request = self._request("read", msgdef.name, c=msgdef.circuit, m=ttl, urgent=True)
+            readline = tuple([line async for line in request])[0]
             values = readline.split(";")
             for fielddef in msgdef.fields:
                 encvalue = fielddef.type_.encode(fielddef, value)
                 values[fielddef.idx] = encvalue
-        async for line in self._request("write", msgdef.name, ";".join(values), c=msgdef.circuit, check=True):
+        await self._throttle(msgdef.circuit, urgent=True)
+        request = self._request("write", msgdef.name, ";".join(values), c=msgdef.circuit, check=True, urgent=True)
+        async for line in request:
             pass
+        self._writes[msgdef.ident] += 1
+        if self.cache is not None:
+            self.cache.remove(msgdef.ident)
+
+    async def listen(self, msgdefs=None, dedup=False, heartbeat=None, lazy=False):
+        """
+        Listen to EBUSD, decode and yield.
 
-    async def listen(self, msgdefs=None):
-        """Listen to EBUSD, decode and yield."""
-        _LOGGER.info(f"listen(msgdefs={msgdefs!r})")
+        With `dedup` the last raw value of every message is remembered and lines with an unchanged value
+        are skipped without decoding. Skipped lines do not refresh the message cache.
+
+        Keyword Args:
+            msgdefs (MsgDefs): Just yield these messages.
+            dedup (bool): Skip messages with unchanged value.
+            heartbeat (int): Yield unchanged messages again, if the last yield is at least `heartbeat` seconds ago.
+            lazy (bool): Yield :any:`LazyMsg` instances, which decode fields on first access.
+        """
+        _LOGGER.info(f"listen(msgdefs={msgdefs!r}, dedup={dedup!r}, heartbeat={heartbeat!r}, lazy={lazy!r})")
+        msgfilter = MsgFilter(msgdefs) if msgdefs is not None else None
+        # raw message ('circuit name') -> (raw value, monotonic time of last decode)
+        lastvalues = {}
+        msgdefs_, generation = self.msgdefs, self.msgdefs.generation
         async for line in self._request("listen", infinite=True):
             if line == "listen started":
                 continue
-            msg = self._decode_line(line)
-            if msg is not None and msgdefs is not None:
-                msg = filter_msg(msg, msgdefs)
+            if dedup:
+                if msgdefs_ is not self.msgdefs or generation != self.msgdefs.generation:
+                    # new definitions may decode the same value differently
+                    lastvalues.clear()
+                    msgdefs_, generation = self.msgdefs, self.msgdefs.generation
+                key, _, value = line.partition(" = ")
+                now = time.monotonic()
+                last = lastvalues.get(key, None)
+                if last is not None and last[0] == value and (heartbeat is None or now - last[1] < heartbeat):
+                    continue
+                lastvalues[key] = (value, now)
+            msg = self._decode_line(line, msgfilter=msgfilter, lazy=lazy)
             if msg:
                 yield msg
 
-    async def observe(self, msgdefs=None, prio=False, ttl=None):
+    async def observe(self, msgdefs=None, prio=False, ttl=None, depth=1):
         """
         Observe.
 
@@ -156,27 +335,24 @@ class Ebus:
         Use `find` to get the latest data, if me missed any updates in the
         meantime and start listening
         """
-        _LOGGER.info(f"observe(msgdefs={msgdefs!r}, prio={prio!r}, ttl={ttl!r})")
+        _LOGGER.info(f"observe(msgdefs={msgdefs!r}, prio={prio!r}, ttl={ttl!r}, depth={depth!r})")
         msgdefs = msgdefs or self.msgdefs
+        msgfilter = MsgFilter(msgdefs)
         data = collections.defaultdict(lambda: None)
 
         # read all
-        for msgdef in msgdefs:
-            if msgdef.read:
-                msg = await self.read(msgdef, prio=prio, ttl=ttl)
-                if msg:
-                    msg = filter_msg(msg, msgdefs)
-                if msg:
-                    yield msg
-                    data[msgdef] = msg
-            elif msgdef.update:
-                data[msgdef] = None
+        async for msg in self.read_many(msgdefs, prio=prio, ttl=ttl, depth=depth):
+            if isinstance(msg, BrokenMsg):
+                _LOGGER.warn(f"{msg.ident}: {msg.error!r}")
+                continue
+            msg = msgfilter(msg)
+            if msg:
+                yield msg
+                data[msg.msgdef] = msg
 
         # find new values (which got updated while we where reading)
         async for line in self._request("find -d"):
-            msg = self._decode_line(line)
-            if msg:
-                msg = filter_msg(msg, msgdefs)
+            msg = self._decode_line(line, msgfilter=msgfilter)
             if msg and msg != data[msg.msgdef]:
                 yield msg
                 data[msg.msgdef] = msg
@@ -185,6 +361,58 @@ class Ebus:
         async for msg in self.listen(msgdefs=msgdefs):
             yield msg
 
+    async def poll(self, msgdefs=None, interval=60, prio=False, depth=1):
+        """
+        Poll all readable messages periodically.
+
+        A message with priority `N` is polled every `N * interval` seconds,
+        a message without priority every `interval` seconds.
+        Polls are never answered from :any:`cache`, as a cached message of the previous poll is nearly one
+        period old. EBUSD may only answer with data which is not older than half of the poll period,
+        which enforces a fresh read for periods below two seconds.
+        Messages are yielded as they arrive, failed reads as :any:`BrokenMsg`.
+
+        Keyword Args:
+            interval (int): Poll interval of messages with priority 1 in seconds
+            prio (bool): Set poll priority
+            depth (int): Number of reads pipelined on one connection.
+        """
+        _LOGGER.info(f"poll(msgdefs={msgdefs!r}, interval={interval!r}, prio={prio!r}, depth={depth!r})")
+        msgdefs = msgdefs or self.msgdefs
+        now = time.monotonic()
+        schedule = [(now, idx, msgdef) for idx, msgdef in enumerate(msgdefs) if msgdef.read]
+        heapq.heapify(schedule)
+        while schedule:
+            await asyncio.sleep(max(0, schedule[0][0] - time.monotonic()))
+            now = time.monotonic()
+            # collect all due messages grouped by their period
+            dues = collections.defaultdict(list)
+            while schedule and schedule[0][0] <= now:
+                due, idx, msgdef = heapq.heappop(schedule)
+                period = interval * (msgdef.prio or 1)
+                dues[period].append(msgdef)
+                # keep cadence, but do not catch up missed polls
+                nextdue = due + period
+                if nextdue <= now:
+                    nextdue = now + period
+                heapq.heappush(schedule, (nextdue, idx, msgdef))
+            for period, duemsgdefs in dues.items():
+                # the previous poll is just about one period old, so allow half of it
+                maxage = int(period / 2)
+                async for msg in self._read_many(duemsgdefs, prio=prio, ttl=maxage, depth=depth, cached=False):
+                    yield msg
+
+    async def _get_scanstate(self):
+        """Return number of messages and number of not yet scanned slaves from EBUSD `info`."""
+        cnt, pending = None, 0
+        async for line in self._request("info"):
+            m = _RE_INFO_MESSAGES.match(line)
+            if m:
+                cnt = int(m.group(1))
+            elif _RE_INFO_SLAVE.match(line) and "scanned" not in line and not line.endswith(", ebusd"):
+                pending += 1
+        return cnt, pending
+
     async def get_state(self):
         """
         Return state string.
@@ -203,26 +431,138 @@ class Ebus:
     async def cmd(self, cmd, infinite=False, check=False):
         """Send `cmd` to EBUSD and Receive Response."""
         _LOGGER.info(f"cmd({cmd!r}, infinite={infinite!r}, check={check!r})")
-        await self.connection.write(cmd)
-        async for line in self.connection.readlines(infinite=infinite, check=check):
+        async for line in self._communicate(cmd, infinite=infinite, check=check):
             yield line
 
-    async def _request(self, cmd, *args, infinite=False, check=False, **kwargs):
+    async def _request(self, cmd, *args, infinite=False, check=False, urgent=False, **kwargs):
         """Assemble request, send and readlines."""
-        parts = [cmd]
-        parts += [f"-{option} {value}" for option, value in kwargs.items() if value is not None]
-        parts += [str(arg) for arg in args]
-        await self.connection.write(" ".join(parts))
-        async for line in self.connection.readlines(infinite=infinite, check=check):
+        message = _assemble(cmd, *args, **kwargs)
+        async for line in self._communicate(message, infinite=infinite, check=check, urgent=urgent):
             yield line
 
-    def _decode_line(self, line):
+    async def _communicate(self, message, infinite=False, check=False, urgent=False):
+        if infinite:
+            await self.connection.write(message)
+            async for line in self.connection.readlines(infinite=True, check=check):
+                yield line
+        else:
+            async with self.pool.acquire(urgent=urgent) as connection:
+                completed = False
+                try:
+                    await connection.write(message)
+                    async for line in connection.readlines(check=check):
+                        yield line
+                    completed = True
+                except CommandError:
+                    # the error response is already consumed
+                    completed = True
+                    raise
+                finally:
+                    if not completed:
+                        # pending response lines would be taken as response of the next request
+                        await connection.disconnect()
+
+    async def _pipeline(self, messages, check=False):
+        async with self.pool.acquire() as connection:
+            completed = False
+            try:
+                async for response in connection.pipeline(messages, check=check):
+                    yield response
+                completed = True
+            finally:
+                if not completed:
+                    # pending response lines would be taken as response of the next request
+                    await connection.disconnect()
+
+    async def _read(self, msgdef, prio=False, ttl=None, cached=True):
+        msg = self._lookup(msgdef, ttl) if cached else None
+        if msg:
+            return msg
+        p = msgdef.prio if prio else None
+        return await self.singleflight.call((msgdef, p, ttl), self._read_request, msgdef, p, ttl)
+
+    async def _read_request(self, msgdef, p, ttl):
+        await self._throttle(msgdef.circuit)
+        writes = self._writes[msgdef.ident]
+        lines = tuple(
+            [line async for line in self._request("read", msgdef.name, c=msgdef.circuit, p=p, m=ttl, check=True)]
+        )
+        return self._decode_value(msgdef, lines[0], writes=writes)
+
+    async def _read_pipelined(self, msgdefs, prio=False, ttl=None):
+        messages = [
+            _assemble("read", msgdef.name, c=msgdef.circuit, p=msgdef.prio if prio else None, m=ttl)
+            for msgdef in msgdefs
+        ]
+        for msgdef in msgdefs:
+            await self._throttle(msgdef.circuit)
+        writes = [self._writes[msgdef.ident] for msgdef in msgdefs]
+        msgs = []
+        responses = [response async for response in self._pipeline(messages, check=True)]
+        for msgdef, response, writes_ in zip(msgdefs, responses, writes):
+            if isinstance(response, CommandError):
+                msgs.append(BrokenMsg(msgdef, response))
+            else:
+                msgs.append(self._decode_value(msgdef, response[0], writes=writes_))
+        return msgs
+
+    async def _throttle(self, circuit, urgent=False):
+        if self.ratelimiter is not None:
+            await self.ratelimiter.acquire(circuit, urgent=urgent)
+
+    def _lookup(self, msgdef, ttl):
+        if self.cache is not None and ttl is not None:
+            msg = self.cache.get(msgdef.ident, ttl)
+            if msg:
+                return filter_msg(msg, (msgdef,))
+        return None
+
+    def _decode_value(self, msgdef, valuestr, writes=None):
+        msg = self.msgdecoder.decode_value(msgdef, valuestr)
+        # a write while reading makes the value outdated
+        if msg and self.cache is not None and (writes is None or writes == self._writes[msgdef.ident]):
+            fullmsgdef = self.msgdefs.get(msgdef.circuit, msgdef.name) or msgdef
+            self._cache_msg(msg, fullmsgdef, valuestr)
+        return msg
+
+    def _cache_msg(self, msg, msgdef, valuestr):
+        # the cache needs the complete message, which is just decoded on access, if `msg` is a projection
+        if msg is None or msg.msgdef is not msgdef:
+            msg = self.msgdecoder.decode_value(msgdef, valuestr, lazy=True)
+        if msg is not None:
+            self.cache.add(msg)
+
+    def _decode_line(self, line, msgfilter=None, lazy=False):
         if line:
             try:
-                return self.msgdecoder.decode_line(line)
+                if self.cache is None:
+                    return self.msgdecoder.decode_line(line, msgfilter=msgfilter, lazy=lazy)
+                msgdef, valuestr = self.msgdecoder.parse_line(line)
+                if valuestr is not None:
+                    msg = self.msgdecoder.decode_value(msgdef, valuestr, lazy=lazy, msgfilter=msgfilter)
+                    self._cache_msg(msg, msgdef, valuestr)
+                    return msg
+                return None
             except UnknownMsgError:
                 return None
             except ValueError as e:
                 _LOGGER.warn(f"Cannot decode message in {line!r}: {e}")
         else:
             return None
+
+
+async def _decode_msgdefs(lines, executor, chunksize):
+    if executor is None or len(lines) <= chunksize:
+        return decode_msgdefs(lines)
+    loop = asyncio.get_event_loop()
+    chunks = [lines[idx : idx + chunksize] for idx in range(0, len(lines), chunksize)]
+    # `gather` keeps the order of the chunks
+    results = await asyncio.gather(*(loop.run_in_executor(executor, decode_msgdefs, chunk) for chunk in chunks))
+    return list(itertools.chain.from_iterable(results))
+
+
+def _assemble(cmd, *args, **kwargs):
+    parts = [cmd]
+    parts += [f"-{option} {value}" for option, value in kwargs.items() if value is not None]
+    parts += [str(arg) for arg in args]
+    return " ".join(parts)
@@ -0,0 +1,70 @@
+import collections
+
+from .util import repr_
+
+
+class Memo:
+    def __init__(self, func, maxsize=256):
+        """
+        Memoization of the single argument function `func`.
+
+        `func` has to return immutable values, as they are shared among all callers.
+        The least recently used result is evicted, if more than `maxsize` results are stored.
+        `stats` counts `hits`, `misses` and `evictions`.
+
+        >>> memo = Memo(int, maxsize=2)
+        >>> memo('1'), memo('2'), memo('1'), memo('3')
+        (1, 2, 1, 3)
+        >>> memo.stats
+        Counter({'misses': 3, 'hits': 1, 'evictions': 1})
+        >>> memo.hitrate
+        0.25
+        """
+        if maxsize < 1:
+            raise ValueError(f"Invalid memo size {maxsize!r}")
+        self._func = func
+        self._maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._hits = self._misses = self._evictions = 0
+
+    def __repr__(self):
+        return repr_(self, args=(self._func,), kwargs=(("maxsize", self.maxsize, 256),))
+
+    @property
+    def maxsize(self):
+        """Maximum Number of Memoized Results."""
+        return self._maxsize
+
+    @property
+    def stats(self):
+        """Statistics."""
+        return collections.Counter(hits=self._hits, misses=self._misses, evictions=self._evictions)
+
+    @property
+    def hitrate(self):
+        """Ratio of hits to all calls."""
+        calls = self._hits + self._misses
+        return self._hits / calls if calls else 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __call__(self, arg):
+        """Return memoized `func(arg)`."""
+        entries = self._entries
+        try:
+            value = entries[arg]
+        except KeyError:
+            value = entries[arg] = self._func(arg)
+            self._misses += 1
+            if len(entries) > self._maxsize:
+                entries.popitem(last=False)
+                self._evictions += 1
+        else:
+            entries.move_to_end(arg)
+            self._hits += 1
+        return value
+
+    def clear(self):
+        """Remove all memoized results."""
+        self._entries.clear()
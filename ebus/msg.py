@@ -19,6 +19,24 @@ class Msg(collections.namedtuple("_Msg", "msgdef fields")):
         return self.msgdef.ident
 
 
+class BrokenMsg(collections.namedtuple("_BrokenMsg", "msgdef error")):
+    __slots__ = tuple()
+
+    def __repr__(self):
+        args = (self.msgdef.name, self.error)
+        return repr_(self, args)
+
+    @property
+    def ident(self):
+        """Identifier."""
+        return self.msgdef.ident
+
+    @property
+    def fields(self):
+        """Fields - always empty."""
+        return tuple()
+
+
 class Field(collections.namedtuple("_Field", "fielddef value")):
     __slots__ = tuple()
 
@@ -34,25 +52,170 @@ class Field(collections.namedtuple("_Field", "fielddef value")):
     @property
     def unitvalue(self):
         """Unitized Value."""
-        value = self.value
-        if value is not None and value is not NA:
-            if not isinstance(value, str) and self.fielddef.unit:
-                return f"{value}{self.fielddef.unit}"
-            else:
-                return value
+        return _unitvalue(self.fielddef, self.value)
+
+
+class LazyMsg:
+
+    __slots__ = ("msgdef", "valuestr", "_decodefields", "_fields")
+
+    def __init__(self, msgdef, valuestr, decodefields):
+        """
+        Message which decodes its fields on first access.
+
+        Behaves like :any:`Msg`, but keeps the raw value string `valuestr`.
+        `decodefields` is called with `valuestr` on first access to `fields` and returns the fields,
+        which might be :any:`LazyField` instances.
+        """
+        self.msgdef = msgdef
+        self.valuestr = valuestr
+        self._decodefields = decodefields
+        self._fields = None
+
+    def __repr__(self):
+        args = (self.msgdef.name, self.fields)
+        return repr_(self, args)
+
+    def __iter__(self):
+        return iter((self.msgdef, self.fields))
+
+    def __eq__(self, other):
+        if isinstance(other, (Msg, LazyMsg)):
+            return (self.msgdef, self.fields) == tuple(other)
         else:
-            return None
+            return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, (Msg, LazyMsg)):
+            return (self.msgdef, self.fields) != tuple(other)
+        else:
+            return NotImplemented
+
+    def __hash__(self):
+        return hash((self.msgdef, self.fields))
+
+    @property
+    def ident(self):
+        """Identifier."""
+        return self.msgdef.ident
+
+    @property
+    def fields(self):
+        """Fields."""
+        fields = self._fields
+        if fields is None:
+            fields = self._fields = self._decodefields(self.valuestr)
+        return fields
+
+
+class LazyField:
+
+    __slots__ = ("fielddef", "_func", "_arg", "_value")
+
+    def __init__(self, fielddef, func, arg):
+        """Field which calculates its value on first access via `func(arg)` and behaves like :any:`Field`."""
+        self.fielddef = fielddef
+        self._func = func
+        self._arg = arg
+        self._value = _UNSET
+
+    def __repr__(self):
+        args = (self.fielddef.name, self.value)
+        return repr_(self, args)
+
+    def __iter__(self):
+        return iter((self.fielddef, self.value))
+
+    def __eq__(self, other):
+        if isinstance(other, (Field, LazyField)):
+            return (self.fielddef, self.value) == tuple(other)
+        else:
+            return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, (Field, LazyField)):
+            return (self.fielddef, self.value) != tuple(other)
+        else:
+            return NotImplemented
+
+    def __hash__(self):
+        return hash((self.fielddef, self.value))
+
+    @property
+    def value(self):
+        """Value."""
+        value = self._value
+        if value is _UNSET:
+            value = self._value = self._func(self._arg)
+            self._func = self._arg = None
+        return value
+
+    @property
+    def ident(self):
+        """Identifier."""
+        return self.fielddef.ident
+
+    @property
+    def unitvalue(self):
+        """Unitized Value."""
+        return _unitvalue(self.fielddef, self.value)
+
+
+_UNSET = object()
+
+
+def _unitvalue(fielddef, value):
+    if value is not None and value is not NA:
+        if not isinstance(value, str) and fielddef.unit:
+            return f"{value}{fielddef.unit}"
+        else:
+            return value
+    else:
+        return None
 
 
 def filter_msg(msg, msgdefs):
     """Strip Down Message."""
-    ident = msg.msgdef.ident
-    for msgdef in msgdefs:
-        if ident == msgdef.ident:
-            if msg.msgdef == msgdef:
-                return msg
-            else:
-                fields = tuple(
-                    Field(field.fielddef, field.value) for field in msg.fields if field.fielddef in msgdef.fields
-                )
-                return Msg(msgdef, fields)
+    return MsgFilter(msgdefs)(msg)
+
+
+class MsgFilter:
+    def __init__(self, msgdefs):
+        """
+        Message Filter.
+
+        Maps the identifier of every message definition in `msgdefs` to the definition and its field names
+        (including virtual fields), so that filtering a :any:`Msg` is one lookup.
+        The first message definition wins, if `msgdefs` contains multiple definitions with the same identifier.
+        """
+        projections = {}
+        for msgdef in msgdefs:
+            ident = msgdef.ident
+            if ident not in projections:
+                projections[ident] = (msgdef, frozenset(fielddef.name for fielddef in msgdef.children))
+        self._projections = projections
+
+    def __len__(self):
+        return len(self._projections)
+
+    def get(self, ident):
+        """Return message definition for `ident` or `None`."""
+        projection = self._projections.get(ident, None)
+        if projection is not None:
+            return projection[0]
+        return None
+
+    def get_projection(self, ident):
+        """Return message definition and its field names for `ident` or `None`."""
+        return self._projections.get(ident, None)
+
+    def __call__(self, msg):
+        """Return `msg` stripped down to the fields of the matching message definition or `None`."""
+        projection = self._projections.get(msg.msgdef.ident, None)
+        if projection is None:
+            return None
+        msgdef, names = projection
+        if msg.msgdef is msgdef or msg.msgdef == msgdef:
+            return msg
+        # `msgdef` selects a subset of the fields (see :any:`MsgDefs.resolve`), which are matched by name
+        return Msg(msgdef, tuple(field for field in msg.fields if field.fielddef.name in names))
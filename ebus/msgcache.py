@@ -0,0 +1,77 @@
+import collections
+import time
+
+from .util import repr_
+
+
+class MsgCache:
+    def __init__(self, maxsize=1024):
+        """
+        Cache of the latest decoded :any:`Msg` per :any:`MsgDef.ident`.
+
+        The least recently used message is evicted, if more than `maxsize` messages are stored.
+        `stats` counts `hits`, `misses` and `evictions`.
+
+        >>> from .msg import Msg
+        >>> from .msgdef import MsgDef
+        >>> cache = MsgCache(maxsize=2)
+        >>> cache.add(Msg(MsgDef('bai', 'Status', ()), ()), timestamp=100)
+        >>> cache.get('bai/Status', maxage=5, now=103)
+        Msg('Status', ())
+        >>> cache.get('bai/Status', maxage=5, now=106)
+        >>> cache.get('bai/Other', maxage=5, now=106)
+        >>> cache.stats
+        Counter({'misses': 2, 'hits': 1, 'evictions': 0})
+        >>> cache.remove('bai/Status')
+        >>> len(cache)
+        0
+        """
+        if maxsize < 1:
+            raise ValueError(f"Invalid cache size {maxsize!r}")
+        self._maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self.stats = collections.Counter(hits=0, misses=0, evictions=0)
+
+    def __repr__(self):
+        return repr_(self, kwargs=(("maxsize", self.maxsize, 1024),))
+
+    @property
+    def maxsize(self):
+        """Maximum Number of Cached Messages."""
+        return self._maxsize
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all cached messages."""
+        self._entries.clear()
+
+    def remove(self, ident):
+        """Remove message with `ident`, if cached."""
+        self._entries.pop(ident, None)
+
+    def add(self, msg, timestamp=None):
+        """Store `msg` received at `timestamp` (default is now, see :any:`time.monotonic`)."""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        entries = self._entries
+        entries[msg.ident] = (timestamp, msg)
+        entries.move_to_end(msg.ident)
+        if len(entries) > self._maxsize:
+            entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def get(self, ident, maxage, now=None):
+        """Return message with `ident`, if it is not older than `maxage` seconds, otherwise `None`."""
+        entry = self._entries.get(ident, None)
+        if entry is not None:
+            timestamp, msg = entry
+            if now is None:
+                now = time.monotonic()
+            if (now - timestamp) <= maxage:
+                self._entries.move_to_end(ident)
+                self.stats["hits"] += 1
+                return msg
+        self.stats["misses"] += 1
+        return None
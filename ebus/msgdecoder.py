@@ -1,64 +1,287 @@
+import collections
 import re
 
+from .memo import Memo
 from .msg import Field
+from .msg import LazyField
+from .msg import LazyMsg
 from .msg import Msg
 from .na import NA
 from .na import NotAvailable
 
+# upper limit of cached decode plans, as `decode_value` may see short-living message definitions
+_MAXPLANS = 4096
+
 
 class MsgDecoder:
 
     _re_decode = re.compile(r"([A-z0-9]+(\.[A-z0-9]+)?) ([^\s]*) (= )?(.*)")
 
-    def __init__(self, msgdefs):
+    def __init__(self, msgdefs, memosize=None):
         """
         Message Decoder.
 
+        Decode plans are compiled once per message definition and dropped on any change of `msgdefs`.
+
+        With `memosize` the decoded values of all :any:`Type.memoizable` types are memoized,
+        up to `memosize` values per type. `memostats` summarizes the statistics of all memos.
+
         Args:
             msgdefs (MsgDefs): Message Definitions
+
+        Keyword Args:
+            memosize (int): Maximum number of memoized values per type.
         """
         self.msgdefs = msgdefs
+        self._memosize = memosize
+        self._memos = {}
+        self._plans = {}
+        self._lineplans = {}
+        self._plansource = None
+        self._plangeneration = None
+
+    @property
+    def memosize(self):
+        """Maximum number of memoized values per type."""
+        return self._memosize
+
+    @property
+    def memos(self):
+        """:any:`Memo` per :any:`Type`."""
+        return dict(self._memos)
 
-    def decode_line(self, line):
+    @property
+    def memostats(self):
+        """Summed statistics of all memos."""
+        stats = collections.Counter(hits=0, misses=0, evictions=0)
+        for memo in self._memos.values():
+            stats.update(memo.stats)
+        return stats
+
+    def decode_line(self, line, msgfilter=None, lazy=False):
         """
         Decode `line` and return :any:`Msg` instance.
 
+        Keyword Args:
+            msgfilter (MsgFilter): Just decode the fields selected by `msgfilter`.
+                                   Equivalent to filtering the decoded message, but skips unwanted fields
+                                   and returns `None` for messages not selected at all.
+            lazy (bool): Return :any:`LazyMsg`, which decodes fields on first access.
+
+        Raises:
+            ValueError: if `line` does not match expected format.
+            UnknownMsgError: if `line` is not covered by fields.
+        """
+        msgdef, plan, valuestr = self._parse_line(line)
+        if msgfilter is not None or lazy:
+            return self.decode_value(msgdef, valuestr, lazy=lazy, msgfilter=msgfilter)
+        if valuestr is not None:
+            return Msg(msgdef, plan(valuestr.split(";")))
+
+    def parse_line(self, line):
+        """
+        Split `line` into message definition and value string, without decoding any field.
+
+        The value string is `None`, if `line` does not contain any data.
+
+        >>> from .msgdefdecoder import decode_msgdefs
+        >>> from .msgdefs import MsgDefs
+        >>> msgdefs = MsgDefs()
+        >>> msgdefs.add(decode_msgdefs(['r,bai,Status,temp,s,UCH,,°C,'])[0])
+        >>> decoder = MsgDecoder(msgdefs)
+        >>> decoder.parse_line('bai Status = 40')
+        (MsgDef('bai', 'Status', (FieldDef(0, 'temp', IntType(0, 254), unit='°C'),), read=True), '40')
+        >>> decoder.parse_line('bai Status = no data stored')[1]
+
         Raises:
             ValueError: if `line` does not match expected format.
             UnknownMsgError: if `line` is not covered by fields.
         """
+        msgdef, _, valuestr = self._parse_line(line)
+        return msgdef, valuestr
+
+    def decode_value(self, msgdef, valuestr, circuit=None, lazy=False, msgfilter=None):
+        """
+        Decode message `msgdef` valuestr `valuestr`, as :any:`LazyMsg` if `lazy`.
+
+        `msgfilter` selects the fields of the complete message definition `msgdef` as in :any:`decode_line`.
+        """
+        if msgfilter is not None:
+            projection = msgfilter.get_projection(msgdef.ident)
+            if projection is None:
+                return None
+            submsgdef, names = projection
+            if submsgdef is not msgdef and submsgdef != msgdef:
+                return self._decode(msgdef, valuestr, submsgdef, names, lazy=lazy)
+        owner = _get_owner(msgdef)
+        if owner is not msgdef:
+            # `msgdef` selects fields of `owner` (see :any:`MsgDefs.resolve`), which might be needed by virtual fields
+            names = frozenset(fielddef.name for fielddef in msgdef.children)
+            return self._decode(owner, valuestr, msgdef, names, lazy=lazy)
+        return self._decode(msgdef, valuestr, msgdef, None, lazy=lazy)
+
+    def get_decoder(self, type_):
+        """Return function which decodes a single value of `type_`, memoized according to :any:`memosize`."""
+        decoder = type_.get_decoder()
+        if self._memosize and type_.memoizable:
+            memo = self._memos.get(type_, None)
+            if memo is None:
+                memo = self._memos[type_] = Memo(decoder, maxsize=self._memosize)
+            decoder = memo
+        return decoder
+
+    def _parse_line(self, line):
         match = self._re_decode.match(line)
         if not match:
             raise ValueError(line)
         circuit, _, name, _, valuestr = match.groups()
-        msgdef = self.msgdefs.get(circuit, name)
-        if not msgdef:
-            raise UnknownMsgError(f"circuit={circuit}, name={name}")
-        return self.decode_value(msgdef, valuestr.strip(), circuit=circuit)
+        self._check_plans()
+        key = (circuit, name)
+        entry = self._lineplans.get(key, None)
+        if entry is None:
+            msgdef = self.msgdefs.get(circuit, name)
+            if not msgdef:
+                raise UnknownMsgError(f"circuit={circuit}, name={name}")
+            entry = self._lineplans[key] = (msgdef, _compile_plan(msgdef, None, self.get_decoder))
+        msgdef, plan = entry
+        valuestr = valuestr.strip()
+        if not valuestr or valuestr == "no data stored" or "ERR: " in valuestr:
+            valuestr = None
+        return msgdef, plan, valuestr
 
-    def decode_value(self, msgdef, valuestr, circuit=None):
-        """Decode message `msgdef` valuestr `valuestr`."""
+    def _decode(self, msgdef, valuestr, resmsgdef, names, lazy=False):
         if valuestr and valuestr != "no data stored" and "ERR: " not in valuestr:
-            fields = tuple(self._decodefields(msgdef, valuestr.split(";")))
-            return Msg(msgdef, fields)
-
-    def _decodefields(self, msgdef, values):
-        fields = []
-        for fielddef in msgdef.fields:
-            if fielddef.idx is None:
-                continue
-            try:
-                value = values[fielddef.idx].strip()
-            except IndexError:
-                fieldvalue = NA
-            else:
-                fieldvalue = fielddef.type_.decode(value)
-            fields.append(Field(fielddef, fieldvalue))
-        for virtfielddef in msgdef.virtfields:
-            virtfieldvalue = virtfielddef.func(fields)
-            fields.append(Field(virtfielddef, virtfieldvalue))
+            plan = self._get_plan(msgdef, names, lazy)
+            if lazy:
+                return LazyMsg(resmsgdef, valuestr, plan)
+            return Msg(resmsgdef, plan(valuestr.split(";")))
+
+    def _check_plans(self):
+        # drop all plans on any modification of the message definitions
+        msgdefs = self.msgdefs
+        if self._plansource is not msgdefs or self._plangeneration != msgdefs.generation:
+            self._plans.clear()
+            self._lineplans.clear()
+            self._plansource = msgdefs
+            self._plangeneration = msgdefs.generation
+
+    def _get_plan(self, msgdef, names, lazy=False):
+        self._check_plans()
+        key = (id(msgdef), names, lazy)
+        entry = self._plans.get(key, None)
+        # the identity check protects against reused ids of message definitions not stored in `msgdefs`
+        if entry is None or entry[0] is not msgdef:
+            if len(self._plans) >= _MAXPLANS:
+                self._plans.clear()
+            compile_ = _compile_lazyplan if lazy else _compile_plan
+            entry = self._plans[key] = (msgdef, compile_(msgdef, names, self.get_decoder))
+        return entry[1]
+
+
+def _get_owner(msgdef):
+    """Return message definition owning the fields of `msgdef`."""
+    children = msgdef.children
+    if children:
+        owner = children[0].parent
+        if owner is not None and owner.circuit == msgdef.circuit and owner.name == msgdef.name:
+            return owner
+    return msgdef
+
+
+def _compile_plan(msgdef, names, getdecoder):
+    """
+    Compile decode function for `msgdef`.
+
+    The function takes the list of value strings and returns the decoded fields.
+    `names` selects fields. Virtual fields are just calculated if selected.
+    `getdecoder` returns the value decoder for a type.
+    """
+    fieldsplan = tuple(
+        (fielddef, fielddef.idx, getdecoder(fielddef.type_)) for fielddef in msgdef.fields if fielddef.idx is not None
+    )
+    virtfielddefs = msgdef.virtfields
+    if names is None:
+        virtplan = tuple((virtfielddef, virtfielddef.func) for virtfielddef in virtfielddefs)
+
+        def decode(values):
+            num = len(values)
+            fields = [
+                Field(fielddef, decoder(values[idx].strip()) if idx < num else NA)
+                for fielddef, idx, decoder in fieldsplan
+            ]
+            if virtplan:
+                allfields = tuple(fields)
+                fields += [Field(virtfielddef, func(allfields)) for virtfielddef, func in virtplan]
+            return tuple(fields)
+
+    else:
+        lazyplan = {fielddef.idx: (fielddef, decoder) for fielddef, _, decoder in fieldsplan}
+        fieldsplan = tuple(item for item in fieldsplan if item[0].name in names)
+        virtplan = tuple(
+            (virtfielddef, virtfielddef.func) for virtfielddef in virtfielddefs if virtfielddef.name in names
+        )
+
+        def decode(values):
+            num = len(values)
+            fields = [
+                Field(fielddef, decoder(values[idx].strip()) if idx < num else NA)
+                for fielddef, idx, decoder in fieldsplan
+            ]
+            if virtplan:
+                allfields = _LazyFields(lazyplan, values, fields)
+                fields += [Field(virtfielddef, func(allfields)) for virtfielddef, func in virtplan]
+            return tuple(fields)
+
+    return decode
+
+
+def _compile_lazyplan(msgdef, names, getdecoder):
+    """
+    Compile lazy decode function for `msgdef`.
+
+    The function takes the value string and returns :any:`LazyField` instances, which decode on first access.
+    `names` selects fields.
+    """
+    fieldsplan = tuple(
+        (fielddef, fielddef.idx, getdecoder(fielddef.type_)) for fielddef in msgdef.fields if fielddef.idx is not None
+    )
+    virtplan = tuple((virtfielddef, virtfielddef.func) for virtfielddef in msgdef.virtfields)
+
+    def decode(valuestr):
+        values = valuestr.split(";")
+        num = len(values)
+        fields = tuple(
+            LazyField(fielddef, decoder, values[idx].strip()) if idx < num else Field(fielddef, NA)
+            for fielddef, idx, decoder in fieldsplan
+        )
+        if virtplan:
+            # virtual fields refer to all fields, selected or not
+            fields += tuple(LazyField(virtfielddef, func, fields) for virtfielddef, func in virtplan)
+        if names is not None:
+            fields = tuple(field for field in fields if field.fielddef.name in names)
         return fields
 
+    return decode
+
+
+class _LazyFields:
+
+    """All fields of a message by index, decoded on first access."""
+
+    def __init__(self, lazyplan, values, fields):
+        self._lazyplan = lazyplan
+        self._values = values
+        self._fields = {field.fielddef.idx: field for field in fields}
+
+    def __getitem__(self, idx):
+        field = self._fields.get(idx, None)
+        if field is None:
+            fielddef, decoder = self._lazyplan[idx]
+            values = self._values
+            value = decoder(values[idx].strip()) if idx < len(values) else NA
+            field = self._fields[idx] = Field(fielddef, value)
+        return field
+
 
 class UnknownMsgError(RuntimeError):
 
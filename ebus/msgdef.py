@@ -1,21 +1,35 @@
-import collections
 import copy
-
-from anytree import NodeMixin
+import functools
 
 from .util import repr_
 
-_MsgDef = collections.namedtuple("_MsgDef", "circuit name read prio write update")
-
-
-class MsgDef(_MsgDef, NodeMixin):
-
-    __slots__ = tuple()
 
-    def __new__(cls, circuit, name, children, read=False, prio=None, write=False, update=False):
+class MsgDef:
+
+    __slots__ = (
+        "circuit",
+        "name",
+        "children",
+        "read",
+        "prio",
+        "write",
+        "update",
+        "_hash",
+        "_ident",
+        "_type",
+        "_fields",
+        "_virtfields",
+    )
+
+    def __init__(self, circuit, name, children, read=False, prio=None, write=False, update=False):
         """
         Message Definition.
 
+        Message definitions are immutable, so hash, identifier, type and fields are calculated just once.
+        Assigning any attribute raises :any:`AttributeError`.
+        Fields are shared with other message definitions (i.e. created by :any:`MsgDefs.resolve`),
+        but refer to the first message definition they have been added to as `parent`.
+
         Args:
             circuit (str): Circuit Name
             name (str): Message Name
@@ -29,10 +43,25 @@ class MsgDef(_MsgDef, NodeMixin):
         """
         if not read:
             prio = None
-        msgdef = _MsgDef.__new__(cls, circuit, name, read, prio, write, update)
-        if children:
-            msgdef.children = children
-        return msgdef
+        children = tuple(children or ())
+        setattr_ = object.__setattr__
+        setattr_(self, "circuit", circuit)
+        setattr_(self, "name", name)
+        setattr_(self, "children", children)
+        setattr_(self, "read", read)
+        setattr_(self, "prio", prio)
+        setattr_(self, "write", write)
+        setattr_(self, "update", update)
+        for child in children:
+            if child._parent is None:
+                setattr_(child, "_parent", self)
+        setattr_(self, "_hash", hash(self.__ident()))
+        setattr_(self, "_ident", f"{circuit}/{name}")
+        setattr_(self, "_type", _get_type(read, prio, write, update))
+        virtfields = tuple(child for child in children if isinstance(child, VirtFieldDef))
+        fields = tuple(child for child in children if isinstance(child, FieldDef)) if virtfields else children
+        setattr_(self, "_fields", fields)
+        setattr_(self, "_virtfields", virtfields)
 
     def __repr__(self):
         args = (self.circuit, self.name, self.children)
@@ -44,55 +73,69 @@ class MsgDef(_MsgDef, NodeMixin):
         ]
         return repr_(self, args, kwargs)
 
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self):
+        return (self.__class__, (self.circuit, self.name, self.children, self.read, self.prio, self.write, self.update))
+
     def __ident(self):
         return (self.circuit, self.name, self.children, self.read, self.prio, self.write, self.update)
 
     def __hash__(self):
-        return hash(self.__ident())
+        return self._hash
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if self.__class__ is other.__class__:
-            return self.__ident() == other.__ident()
+            return self._hash == other._hash and self.__ident() == other.__ident()
         else:
             return NotImplemented
 
     def __ne__(self, other):
+        if self is other:
+            return False
         if self.__class__ is other.__class__:
-            return self.__ident() != other.__ident()
+            return self._hash != other._hash or self.__ident() != other.__ident()
         else:
             return NotImplemented
 
     @property
     def fields(self):
         """Fields."""
-        return tuple(child for child in self.children if isinstance(child, FieldDef))
+        return self._fields
 
     @property
     def virtfields(self):
         """Generic Fields."""
-        return tuple(child for child in self.children if isinstance(child, VirtFieldDef))
+        return self._virtfields
 
     @property
     def ident(self):
         """Identifier."""
-        return f"{self.circuit}/{self.name}"
+        return self._ident
 
     @property
     def type_(self):
         """Message Type."""
-        r = "r" if self.read else "-"
-        p = f"{self.prio}" if self.prio else "-"
-        w = "w" if self.write else "-"
-        u = "u" if self.update else "-"
-        return "".join((r, p, w, u))
+        return self._type
 
     def join(self, msgdef):
-        """Return Joined Message Definition."""
+        """
+        Return Joined Message Definition.
+
+        The joined message definition owns copies of the fields,
+        as the fields of both message definitions might be in use and are never modified.
+        """
         if (self.circuit, self.name, self.children) == (msgdef.circuit, msgdef.name, msgdef.children):
             return MsgDef(
                 self.circuit,
                 self.name,
-                tuple(copy.copy(fielddef) for fielddef in self.children),
+                tuple(copy.copy(child) for child in self.children),
                 read=self.read or msgdef.read,
                 prio=self.prio or msgdef.prio,
                 write=self.write or msgdef.write,
@@ -102,17 +145,25 @@ class MsgDef(_MsgDef, NodeMixin):
             return None
 
 
-_FieldDef = collections.namedtuple("_FieldDef", "idx name type_ unit comment")
+@functools.lru_cache(maxsize=None)
+def _get_type(read, prio, write, update):
+    r = "r" if read else "-"
+    p = f"{prio}" if prio else "-"
+    w = "w" if write else "-"
+    u = "u" if update else "-"
+    return "".join((r, p, w, u))
 
 
-class AbstractFieldDef(_FieldDef, NodeMixin):
+class AbstractFieldDef:
 
-    __slots__ = tuple()
+    __slots__ = ("idx", "name", "type_", "unit", "comment", "_parent", "_hash")
 
-    def __new__(cls, idx, name, type_, unit=None, comment=None):
+    def __init__(self, idx, name, type_, unit=None, comment=None):
         """
         Abstract Field Definition.
 
+        Field definitions are immutable. Assigning any attribute raises :any:`AttributeError`.
+
         Args:
             idx (str): Index within Message
             name (str): Unique name (as `name` may be used multiple times by ebus)
@@ -122,7 +173,14 @@ class AbstractFieldDef(_FieldDef, NodeMixin):
             unit (str): Unit of the field value
             comment (str): Comment.
         """
-        return _FieldDef.__new__(cls, idx, name, type_, unit or None, comment or None)
+        setattr_ = object.__setattr__
+        setattr_(self, "idx", idx)
+        setattr_(self, "name", name)
+        setattr_(self, "type_", type_)
+        setattr_(self, "unit", unit or None)
+        setattr_(self, "comment", comment or None)
+        setattr_(self, "_parent", None)
+        setattr_(self, "_hash", hash(self._ident()))
 
     def __repr__(self):
         args = (self.idx, self.name, self.type_)
@@ -132,30 +190,69 @@ class AbstractFieldDef(_FieldDef, NodeMixin):
         ]
         return repr_(self, args, kwargs)
 
-    def _pre_detach(self, parent):
-        # it is forbidden to remove fields from their message - create new one
-        assert False, f"{self!r} is already used by {parent!r}"  # pragma: no cover
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self):
+        # the parent is restored by the message definition
+        return (self.__class__, (self.idx, self.name, self.type_, self.unit, self.comment))
+
+    def _ident(self):
+        return (self.idx, self.name, self.type_, self.unit, self.comment)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if self.__class__ is other.__class__:
+            return self._hash == other._hash and self._ident() == other._ident()
+        else:
+            return NotImplemented
+
+    def __ne__(self, other):
+        if self is other:
+            return False
+        if self.__class__ is other.__class__:
+            return self._hash != other._hash or self._ident() != other._ident()
+        else:
+            return NotImplemented
+
+    @property
+    def parent(self):
+        """Message Definition, which owns the field."""
+        return self._parent
 
     @property
     def msgdef(self):
         """Message Definition."""
-        return self.parent
+        return self._parent
 
     @property
     def ident(self):
         """Identifier."""
-        return f"{self.parent.ident}/{self.name}" if self.parent else None
+        return f"{self._parent.ident}/{self.name}" if self._parent else None
 
     def __copy__(self):
-        return FieldDef(idx=self.idx, name=self.name, type_=self.type_, unit=self.unit)
+        # the copy has no parent yet
+        cls, args = self.__reduce__()
+        return cls(*args)
 
 
 class FieldDef(AbstractFieldDef):
-    pass
+
+    __slots__ = tuple()
 
 
 class VirtFieldDef(AbstractFieldDef):
-    def __new__(cls, name, type_, func, unit=None, comment=None):
+
+    __slots__ = ("func",)
+
+    def __init__(self, name, type_, func, unit=None, comment=None):
         """
         Virtual Field Definition.
 
@@ -168,9 +265,11 @@ class VirtFieldDef(AbstractFieldDef):
             unit (str): Unit of the field value
             comment (str): Comment.
         """
-        obj = AbstractFieldDef.__new__(cls, None, name, type_, unit or None, comment or None)
-        obj.func = func
-        return obj
+        super().__init__(None, name, type_, unit=unit, comment=comment)
+        object.__setattr__(self, "func", func)
 
     def __repr__(self):
         return repr_(self, (self.name, self.type_))
+
+    def __reduce__(self):
+        return (self.__class__, (self.name, self.type_, self.func, self.unit, self.comment))
@@ -1,12 +1,20 @@
-import collections
+import functools
+import logging
 import re
+import sys
 
 from .msgdef import FieldDef
 from .msgdef import MsgDef
 from .types import EnumType
 from .types import gettype
+from .types import intern_type
 from .virtfielddef import iter_virtfielddefs
 
+_LOGGER = logging.getLogger(__name__)
+
+_RE_SPLIT = re.compile(r'("([^"]+)")|([^\,]*),')
+_RE_TYPE = re.compile(r"(r)([1-9]?)")
+
 # https://github.com/john30/ebusd/wiki/4.1.-Message-definition#message-definition
 
 
@@ -40,18 +48,41 @@ def decode_msgdef(line):
         raise ValueError(f"Invalid message definition {line!r}") from None
     for child in iter_virtfielddefs(children):
         children.append(child)
-    return MsgDef(circuit, name, tuple(children), read, prio, write, update)
+    return MsgDef(sys.intern(circuit), sys.intern(name), tuple(children), read, prio, write, update)
+
+
+def decode_msgdefs(lines):
+    """
+    Decode all message definition `lines` and return a list with one :any:`MsgDef` per line.
+
+    Invalid lines are logged and result in `None`.
+
+    >>> [m and m.name for m in decode_msgdefs(['r,bai,Status,temp,s,UCH,,°C,', 'r,bai'])]
+    ['Status', None]
+    """
+    msgdefs = []
+    for line in lines:
+        try:
+            msgdef = decode_msgdef(line)
+        except ValueError as e:
+            _LOGGER.warning(f"Cannot decode message definition ({e})")
+            msgdef = None
+        msgdefs.append(msgdef)
+    return msgdefs
 
 
 def _split(line):
+    if '"' not in line:
+        # equivalent to `_RE_SPLIT`, which ignores everything behind the last comma
+        return line.split(",")[:-1]
     values = []
-    r = re.compile(r'("([^"]+)")|([^\,]*),')
-    for idx, m in enumerate(r.finditer(line)):
+    for m in _RE_SPLIT.finditer(line):
         groups = m.groups()
         values.append(groups[1] or groups[2])
     return values
 
 
+@functools.lru_cache(maxsize=None)
 def decodetype(type_):
     """
     Decode Type.
@@ -63,8 +94,7 @@ def decodetype(type_):
     >>> decodetype('u')
     (False, None, False, True)
     """
-    r = re.compile(r"(r)([1-9]?)")
-    m = r.match(type_)
+    m = _RE_TYPE.match(type_)
     if m:
         read = m.group(1) is not None
         prio = int(m.group(2)) if m.group(2) else None
@@ -77,38 +107,44 @@ def decodetype(type_):
 
 def _decodefields(values):
     if len(values) % 6 in (0, 3, 4, 5):
-        chunks = _chunks(values, 6)
-        return list(_createfields(chunks))
+        return _createfields([values[i : i + 6] for i in range(0, len(values), 6)])
     else:
         raise ValueError()
 
 
 def _createfields(chunks):
-    if chunks:
-        # determine duplicate names
-        fields = []
-        dups = collections.defaultdict(lambda: -1)
-        for chunk in chunks:
-            name, _, datatype = chunk[:3]
-            if not datatype.startswith("IGN"):
-                fields.append(chunk)
-                dups[name] += 1
-        # create fields
-        cnts = collections.defaultdict(lambda: 0)
-        for idx, field in enumerate(fields):
-            name = field[0]
-            if dups[name]:
-                cnt = cnts[name]
-                cnts[name] = cnt + 1
-                name = f"{name}.{cnt}"
-            else:
-                name = name
-            yield _createfield(idx, name, *field)
-
-
-def _createfield(idx, name, ename, part, datatype, dividervalues=None, unit=None, comment=None):
+    chunks = [chunk for chunk in chunks if not chunk[2].startswith("IGN")]
+    names = [chunk[0] for chunk in chunks]
+    if len(set(names)) == len(names):
+        return [_createfield(idx, *chunk) for idx, chunk in enumerate(chunks)]
+    # number duplicate names
+    dups = {name for name in names if names.count(name) > 1}
+    cnts = dict.fromkeys(dups, 0)
+    fields = []
+    for idx, chunk in enumerate(chunks):
+        name = chunk[0]
+        if name in dups:
+            cnt = cnts[name]
+            cnts[name] = cnt + 1
+            name = f"{name}.{cnt}"
+        fields.append(_createfield(idx, name, *chunk[1:]))
+    return fields
+
+
+def _createfield(idx, name, part, datatype, dividervalues=None, unit=None, comment=None):
+    # names, units and comments repeat across many definitions, so they are shared
+    return FieldDef(idx, sys.intern(name), _gettype(datatype, dividervalues), _intern(unit), _intern(comment))
+
+
+def _intern(value):
+    return sys.intern(value) if value else None
+
+
+@functools.lru_cache(maxsize=None)
+def _gettype(datatype, dividervalues):
+    # Types are immutable, so all fields with the same type share one instance
     if dividervalues and "=" in dividervalues:
-        type_ = EnumType(tuple(pair.split("=", 1)[1] for pair in dividervalues.split(";")))
+        return intern_type(EnumType(tuple(sys.intern(pair.split("=", 1)[1]) for pair in dividervalues.split(";"))))
     else:
         ebustype = datatype.split(",")[0]
         if dividervalues:
@@ -117,9 +153,4 @@ def _createfield(idx, name, ename, part, datatype, dividervalues=None, unit=None
                 divider = 1 / -divider
         else:
             divider = None
-        type_ = gettype(ebustype, divider)
-    return FieldDef(idx, name, type_, unit, comment)
-
-
-def _chunks(list_or_tuple, maxsize):
-    return [list_or_tuple[i : i + maxsize] for i in range(0, len(list_or_tuple), maxsize)]
+        return gettype(ebustype, divider)
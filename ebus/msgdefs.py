@@ -1,10 +1,16 @@
+import bisect
 import collections
-import copy
+import functools
+import itertools
 import re
-from fnmatch import fnmatchcase
+from fnmatch import translate
 
 from .msgdef import MsgDef
 
+MsgDefsDiff = collections.namedtuple("MsgDefsDiff", "added removed changed")
+
+_RE_WILDCARD = re.compile(r"[*?\[]")
+
 
 class MsgDefs:
 
@@ -35,15 +41,27 @@ class MsgDefs:
         >>> msgdefs.summary()
         '2 messages (2 read, 0 update, 0 write) with 7 fields'
         """
+        self._generation = 0
         self.clear()
 
+    @property
+    def generation(self):
+        """Modification Counter, incremented on every change."""
+        return self._generation
+
     def clear(self):
         """Remove All Stored Message Definitions."""
         self._msgdefs = collections.defaultdict(lambda: collections.defaultdict(list))
+        self._index = None
+        self._generation += 1
 
     def add(self, msgdef):
         """Add Message Definition."""
-        msgdefs = self._msgdefs[msgdef.circuit][msgdef.name]
+        circuitmsgdefs = self._msgdefs[msgdef.circuit]
+        if msgdef.name not in circuitmsgdefs:
+            self._index = None
+        self._generation += 1
+        msgdefs = circuitmsgdefs[msgdef.name]
         for idx, md in enumerate(msgdefs):
             joined = md.join(msgdef)
             if joined is not None:
@@ -52,6 +70,70 @@ class MsgDefs:
         else:
             msgdefs.append(msgdef)
 
+    def update(self, msgdefs):
+        """
+        Take over all message definitions from `msgdefs` and return the differences as :any:`MsgDefsDiff`.
+
+        Unchanged message definitions are kept as they are.
+
+        >>> from .msgdef import MsgDef, FieldDef
+        >>> from .types import Type
+        >>> msgdefs = MsgDefs()
+        >>> msgdefs.add(MsgDef('mc', 'Status', (FieldDef(0, 'temp', Type(), '°C'),), read=True))
+        >>> msgdefs.add(MsgDef('mc', 'Mode', (FieldDef(0, 'mode', Type()),), read=True))
+        >>> newmsgdefs = MsgDefs()
+        >>> newmsgdefs.add(MsgDef('mc', 'Status', (FieldDef(0, 'temp', Type(), '°C'),), read=True, write=True))
+        >>> newmsgdefs.add(MsgDef('hc', 'Status', (FieldDef(0, 'temp', Type(), '°C'),), read=True))
+        >>> diff = msgdefs.update(newmsgdefs)
+        >>> [msgdef.ident for msgdef in diff.added]
+        ['hc/Status']
+        >>> [msgdef.ident for msgdef in diff.removed]
+        ['mc/Mode']
+        >>> [msgdef.ident for msgdef in diff.changed]
+        ['mc/Status']
+        >>> msgdefs.summary()
+        '2 messages (2 read, 0 update, 1 write) with 2 fields'
+        """
+        added, removed, changed = [], [], []
+        current = self._msgdefs
+        updated = collections.defaultdict(lambda: collections.defaultdict(list))
+        for circuit, circuitmsgdefs in msgdefs._msgdefs.items():
+            currentcircuitmsgdefs = current.get(circuit, {})
+            for name, entries in circuitmsgdefs.items():
+                entries = list(entries)
+                currententries = currentcircuitmsgdefs.get(name, None)
+                if currententries is not None:
+                    currententries = list(currententries)
+                if currententries is None:
+                    added.extend(entries)
+                elif currententries != entries:
+                    changed.extend(entries)
+                else:
+                    entries = currententries
+                updated[circuit][name] = list(entries)
+        for circuit, circuitmsgdefs in current.items():
+            updatedcircuitmsgdefs = updated.get(circuit, {})
+            for name, entries in circuitmsgdefs.items():
+                if name not in updatedcircuitmsgdefs:
+                    removed.extend(entries)
+        self._msgdefs = updated
+        self._index = None
+        self._generation += 1
+        return MsgDefsDiff(tuple(added), tuple(removed), tuple(changed))
+
+    def copy(self):
+        """Return a mutable copy, which shares the message definitions."""
+        msgdefs = MsgDefs()
+        for circuit, circuitmsgdefs in self._msgdefs.items():
+            for name, entries in circuitmsgdefs.items():
+                msgdefs._msgdefs[circuit][name] = list(entries)
+        msgdefs._generation = self._generation
+        return msgdefs
+
+    def freeze(self):
+        """Return an immutable snapshot as :any:`FrozenMsgDefs`."""
+        return FrozenMsgDefs(self)
+
     def get(self, circuit, name):
         """Retrieve circuit message of `circuit` with `name`."""
         msgdefs = self._msgdefs
@@ -63,11 +145,35 @@ class MsgDefs:
     def find(self, circuit, name="*"):
         """Find Message Definitions of `circuit` with `name`."""
         msgdefs = MsgDefs()
-        for msgdef in self:
-            if fnmatchcase(msgdef.circuit, circuit) and fnmatchcase(msgdef.name, name):
-                msgdefs.add(msgdef)
+        for entries in self._find(circuit, name):
+            circuitmsgdefs = msgdefs._msgdefs[entries[0].circuit]
+            circuitmsgdefs[entries[0].name] = list(entries)
         return msgdefs
 
+    def _find(self, circuit, name):
+        """Iterate over message definition lists matching `circuit` and `name` in order of insertion."""
+        circuits, names = self._get_index()
+        matches = []
+        for circuit_ in _match(circuits, circuit):
+            circuitrank, circuitnames, nameranks = names[circuit_]
+            for name_ in _match(circuitnames, name):
+                matches.append((circuitrank, nameranks[name_], circuit_, name_))
+        matches.sort()
+        msgdefs = self._msgdefs
+        for _, _, circuit_, name_ in matches:
+            yield msgdefs[circuit_][name_]
+
+    def _get_index(self):
+        """Sorted circuit names and per circuit: insertion rank, sorted message names and their insertion ranks."""
+        index = self._index
+        if index is None:
+            names = {}
+            for circuitrank, (circuit, circuitmsgdefs) in enumerate(self._msgdefs.items()):
+                nameranks = {name: rank for rank, name in enumerate(circuitmsgdefs)}
+                names[circuit] = (circuitrank, sorted(nameranks), nameranks)
+            index = self._index = (sorted(names), names)
+        return index
+
     def resolve(self, patterns, filter_=None):
         """Resolve patterns and filter message definitions."""
         msgdefs = MsgDefs()
@@ -81,11 +187,11 @@ class MsgDefs:
         m = self._re_resolve.fullmatch(pattern)
         if m:
             circuit, name, _, prio, _, fieldname = m.groups()
-            for msgdef in self.find(circuit, name):
+            for msgdef in itertools.chain.from_iterable(self._find(circuit, name)):
                 if fieldname is None:
                     fields = msgdef.children
                 else:
-                    fields = tuple(fielddef for fielddef in msgdef.children if fnmatchcase(fielddef.name, fieldname))
+                    fields = tuple(fielddef for fielddef in msgdef.children if _matches(fielddef.name, fieldname))
                 if not fields:
                     continue
                 if fields == msgdef.children and (prio is None or not msgdef.read):
@@ -98,7 +204,7 @@ class MsgDefs:
                     yield MsgDef(
                         msgdef.circuit,
                         msgdef.name,
-                        tuple(copy.copy(fielddef) for fielddef in fields),
+                        fields,
                         read=msgdef.read,
                         prio=prio,
                         write=msgdef.write,
@@ -116,6 +222,14 @@ class MsgDefs:
         write = sum([1 for msgdef in self if msgdef.write])
         return f"{total} messages ({read} read, {update} update, {write} write) with {fields} fields"
 
+    def __contains__(self, msgdef):
+        circuitmsgdefs = self._msgdefs.get(msgdef.circuit, None)
+        if circuitmsgdefs is not None:
+            msgdefs = circuitmsgdefs.get(msgdef.name, None)
+            if msgdefs is not None:
+                return msgdef in msgdefs
+        return False
+
     def __iter__(self):
         for circuitmsgdefs in self._msgdefs.values():
             for msgdefs in circuitmsgdefs.values():
@@ -125,3 +239,83 @@ class MsgDefs:
         return sum(
             sum(len(msgdefs) for msgdefs in circuitmsgdefs.values()) for circuitmsgdefs in self._msgdefs.values()
         )
+
+
+class FrozenMsgDefs(MsgDefs):
+    def __init__(self, msgdefs=None):
+        """
+        Immutable Snapshot of Message Definitions.
+
+        The snapshot is built from plain dictionaries and tuples and its lookup index is created upfront,
+        so it can be shared between threads without locks and pickled to other processes.
+        Changes are done on a :any:`MsgDefs.copy` and published as a new snapshot.
+
+        >>> from .msgdef import MsgDef, FieldDef
+        >>> from .types import Type
+        >>> msgdefs = MsgDefs()
+        >>> msgdefs.add(MsgDef('mc', 'Status', (FieldDef(0, 'temp', Type(), '°C'),), read=True))
+        >>> snapshot = msgdefs.freeze()
+        >>> snapshot.get('mc', 'Status')
+        MsgDef('mc', 'Status', (FieldDef(0, 'temp', Type(), unit='°C'),), read=True)
+        >>> snapshot.add(MsgDef('mc', 'Mode', (FieldDef(0, 'mode', Type()),), read=True))
+        Traceback (most recent call last):
+          ...
+        TypeError: FrozenMsgDefs is immutable
+
+        Keyword Args:
+            msgdefs (MsgDefs): Message Definitions
+        """
+        if msgdefs is not None:
+            self._msgdefs = {
+                circuit: {name: tuple(entries) for name, entries in circuitmsgdefs.items()}
+                for circuit, circuitmsgdefs in msgdefs._msgdefs.items()
+            }
+            self._generation = msgdefs.generation
+        else:
+            self._msgdefs = {}
+            self._generation = 0
+        self._index = None
+        self._get_index()
+
+    def clear(self):
+        """Not supported, as the snapshot is immutable."""
+        raise TypeError(f"{self.__class__.__name__} is immutable")
+
+    def add(self, msgdef):
+        """Not supported, as the snapshot is immutable."""
+        raise TypeError(f"{self.__class__.__name__} is immutable")
+
+    def update(self, msgdefs):
+        """Not supported, as the snapshot is immutable."""
+        raise TypeError(f"{self.__class__.__name__} is immutable")
+
+    def freeze(self):
+        """Return the snapshot itself."""
+        return self
+
+
+@functools.lru_cache(maxsize=512)
+def _compile(pattern):
+    """Return literal prefix of `pattern` and match function (`None` if `pattern` has no wildcards)."""
+    m = _RE_WILDCARD.search(pattern)
+    if m:
+        return pattern[: m.start()], re.compile(translate(pattern)).match
+    else:
+        return pattern, None
+
+
+def _match(keys, pattern):
+    """Return all items of the sorted `keys` which match `pattern`."""
+    prefix, match = _compile(pattern)
+    lo = bisect.bisect_left(keys, prefix)
+    if match is None:
+        return keys[lo : lo + 1] if keys[lo : lo + 1] == [prefix] else []
+    hi = bisect.bisect_left(keys, prefix + chr(0x10FFFF)) if prefix else len(keys)
+    return [key for key in keys[lo:hi] if match(key)]
+
+
+def _matches(name, pattern):
+    prefix, match = _compile(pattern)
+    if match is None:
+        return name == prefix
+    return match(name) is not None
@@ -0,0 +1,102 @@
+import hashlib
+import logging
+import os
+import pathlib
+import pickle
+
+from .util import repr_
+
+_LOGGER = logging.getLogger(__name__)
+
+# increment on any change of the stored data or of the pickled classes
+_VERSION = 4
+
+
+class MsgDefsCache:
+    def __init__(self, dirpath=None):
+        """
+        Persistent Cache of decoded Message Definitions.
+
+        The cache stores a `dict` which maps every definition line to its :any:`MsgDef` (or `None`).
+
+        One file per EBUSD host and port is stored in `dirpath` (default is `~/.cache/ebus`).
+        A file is only valid for the :any:`fingerprint` of the message definitions it was created from.
+
+        Keyword Args:
+            dirpath (str): Cache directory
+        """
+        self._dirpath = pathlib.Path(dirpath) if dirpath else pathlib.Path.home() / ".cache" / "ebus"
+
+    def __repr__(self):
+        return repr_(self, args=(str(self.dirpath),))
+
+    @property
+    def dirpath(self):
+        """Cache Directory."""
+        return self._dirpath
+
+    def get_filepath(self, host, port):
+        """Cache file for `host` and `port`."""
+        return self._dirpath / f"msgdefs-{host}-{port}.pickle"
+
+    def load(self, host, port, fingerprint):
+        """Return stored line-to-definition mapping for `host` and `port` or `None` if missing or outdated."""
+        filepath = self.get_filepath(host, port)
+        try:
+            with filepath.open("rb") as file:
+                data = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            _LOGGER.warning(f"Cannot load {str(filepath)!r} ({e!r})")
+            return None
+        if not isinstance(data, dict) or data.get("version", None) != _VERSION:
+            _LOGGER.info(f"Ignore {str(filepath)!r} with outdated version")
+            return None
+        if data["fingerprint"] != fingerprint:
+            _LOGGER.info(f"Ignore {str(filepath)!r} with outdated fingerprint")
+            return None
+        return data["msgdefs"]
+
+    def save(self, host, port, fingerprint, msgdefs):
+        """Store line-to-definition mapping `msgdefs` for `host` and `port` with `fingerprint`."""
+        filepath = self.get_filepath(host, port)
+        data = {"version": _VERSION, "fingerprint": fingerprint, "msgdefs": msgdefs}
+        tmpfilepath = filepath.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            with tmpfilepath.open("wb") as file:
+                pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+            # concurrent readers never see a partial file
+            os.replace(tmpfilepath, filepath)
+        except OSError as e:
+            _LOGGER.warning(f"Cannot save {str(filepath)!r} ({e!r})")
+        finally:
+            # any failure, e.g. an unpicklable definition, must not leave the temporary file behind
+            try:
+                tmpfilepath.unlink()
+            except OSError:
+                pass
+
+    def remove(self, host, port):
+        """Remove cache file for `host` and `port`."""
+        try:
+            self.get_filepath(host, port).unlink()
+        except FileNotFoundError:
+            pass
+
+
+def fingerprint(lines):
+    """
+    Fingerprint of message definition `lines`.
+
+    >>> fingerprint(['r,bai,Status,temp,s,UCH,,°C,']) == fingerprint(['r,bai,Status,temp,s,UCH,,°C,'])
+    True
+    >>> fingerprint(['r,bai,Status,temp,s,UCH,,°C,']) == fingerprint(['r,bai,Status,temp,s,SCH,,°C,'])
+    False
+    """
+    hash_ = hashlib.sha256()
+    for line in lines:
+        hash_.update(line.encode("utf-8"))
+        hash_.update(b"\n")
+    return hash_.hexdigest()
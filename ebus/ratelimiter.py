@@ -0,0 +1,111 @@
+import asyncio
+import collections
+import heapq
+import itertools
+import logging
+import time
+
+from .util import repr_
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    def __init__(self, rate=1, burst=1, rates=None):
+        """
+        Token bucket rate limiter with a separate budget per circuit.
+
+        Every circuit may send `rate` commands per second and up to `burst` commands at once.
+        Urgent commands (i.e. writes) are served before all other waiting commands.
+
+        `stats` counts the `requests`, the `delayed` ones and their total and maximum wait time
+        in seconds (`waittime`, `maxwaittime`).
+
+        Keyword Args:
+            rate (float): Commands per second per circuit
+            burst (int): Maximum number of commands at once per circuit
+            rates (dict): Circuit specific `rate`
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"Invalid rate {rate!r} or burst {burst!r}")
+        self._rate = rate
+        self._burst = burst
+        self._rates = dict(rates or {})
+        self._buckets = {}
+        self._seq = itertools.count()
+        self.stats = collections.Counter(requests=0, delayed=0, waittime=0.0, maxwaittime=0.0)
+
+    def __repr__(self):
+        return repr_(self, kwargs=(("rate", self.rate, 1), ("burst", self.burst, 1), ("rates", self._rates, {})))
+
+    @property
+    def rate(self):
+        """Commands per second per circuit."""
+        return self._rate
+
+    @property
+    def burst(self):
+        """Maximum number of commands at once per circuit."""
+        return self._burst
+
+    def get_rate(self, circuit):
+        """Commands per second on `circuit`."""
+        return self._rates.get(circuit, self._rate)
+
+    async def acquire(self, circuit, urgent=False):
+        """Wait until a command may be sent on `circuit`."""
+        bucket = self._get_bucket(circuit)
+        start = time.monotonic()
+        bucket.refill(start)
+        self.stats["requests"] += 1
+        if not bucket.waiters and bucket.tokens >= 1:
+            bucket.tokens -= 1
+        else:
+            future = asyncio.get_event_loop().create_future()
+            heapq.heappush(bucket.waiters, (0 if urgent else 1, next(self._seq), future))
+            self._schedule(bucket)
+            await future
+            waittime = time.monotonic() - start
+            _LOGGER.debug(f"acquire({circuit!r}, urgent={urgent!r}) waited {waittime:.3f}s")
+            self.stats["delayed"] += 1
+            self.stats["waittime"] += waittime
+            self.stats["maxwaittime"] = max(self.stats["maxwaittime"], waittime)
+
+    def _get_bucket(self, circuit):
+        bucket = self._buckets.get(circuit, None)
+        if bucket is None:
+            bucket = self._buckets[circuit] = _Bucket(self.get_rate(circuit), self._burst)
+        return bucket
+
+    def _schedule(self, bucket):
+        if bucket.handle is None and bucket.waiters:
+            delay = max(0, (1 - bucket.tokens) / bucket.rate)
+            bucket.handle = asyncio.get_event_loop().call_later(delay, self._dispatch, bucket)
+
+    def _dispatch(self, bucket):
+        bucket.handle = None
+        bucket.refill(time.monotonic())
+        while bucket.waiters and bucket.tokens >= 1:
+            _, _, future = heapq.heappop(bucket.waiters)
+            # cancelled waiters do not consume any token
+            if not future.done():
+                future.set_result(None)
+                bucket.tokens -= 1
+        self._schedule(bucket)
+
+
+class _Bucket:
+
+    __slots__ = ("rate", "burst", "tokens", "stamp", "waiters", "handle")
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.stamp = time.monotonic()
+        self.waiters = []
+        self.handle = None
+
+    def refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
@@ -0,0 +1,44 @@
+import asyncio
+import collections
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    def __init__(self):
+        """
+        Share one running call among all concurrent callers with the same key.
+
+        `stats` counts the issued `calls` and the `coalesced` ones, which just waited for an issued call.
+        """
+        self._tasks = {}
+        self.stats = collections.Counter(calls=0, coalesced=0)
+
+    def __len__(self):
+        return len(self._tasks)
+
+    async def call(self, key, func, *args, **kwargs):
+        """
+        Await `func(*args, **kwargs)`, if there is no running call with `key`.
+
+        Otherwise wait for the running call and return its result.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            self.stats["calls"] += 1
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._tasks[key] = task
+            task.add_done_callback(lambda task: self._done(key, task))
+        else:
+            _LOGGER.debug(f"coalesce {key!r}")
+            self.stats["coalesced"] += 1
+        # one cancelled caller must not cancel the call of the others
+        return await asyncio.shield(task)
+
+    def _done(self, key, task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # mark exception as retrieved, even if all callers are gone
+            task.exception()
@@ -1,12 +1,27 @@
 import datetime
+import functools
 import re
 
 from .util import repr_
 
 _RE_BIT = re.compile(r"\ABI\d(:(\d))?\Z")
+# fixed formats 'dd.mm.yyyy', 'HH:MM:SS' and 'HH:MM', accepting the same strings as `strptime`
+_RE_DATE = re.compile(r"\A(\d\d?| \d)\.(\d\d?)\.(\d\d\d\d)\Z")
+_RE_TIME = re.compile(r"\A(\d\d?):(\d\d?):(\d\d?)\Z")
+_RE_SHORTTIME = re.compile(r"\A(\d\d?):(\d\d?)\Z")
 
 
 class Type:
+
+    # Decoded values are immutable and worth to be memoized (see :any:`Memo`)
+    memoizable = False
+
+    # Decoded values are numbers or booleans (see :any:`BatchDecoder`)
+    numeric = False
+
+    # Types are immutable, so the hash is calculated on first use only
+    _hash = None
+
     def __init__(self):
         """Abstract Type."""
         pass
@@ -14,21 +29,38 @@ class Type:
     def __repr__(self):
         return repr_(self, self._getargs(), self._getkwargs())
 
+    def __getstate__(self):
+        # string hashes differ between interpreter runs
+        state = self.__dict__.copy()
+        state.pop("_hash", None)
+        return state
+
+    def __reduce__(self):
+        # unpickled types are interned as well (i.e. from a cache file or an executor)
+        return (_unpickle_type, (self.__class__, self.__getstate__()))
+
     def __ident(self):
         return self._getargs(), self._getkwargs()
 
     def __hash__(self):
-        return hash(self.__ident())
+        hash_ = self._hash
+        if hash_ is None:
+            hash_ = self._hash = hash(self.__ident())
+        return hash_
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if self.__class__ is other.__class__:
-            return self.__ident() == other.__ident()
+            return hash(self) == hash(other) and self.__ident() == other.__ident()
         else:
             return NotImplemented
 
     def __ne__(self, other):
+        if self is other:
+            return False
         if self.__class__ is other.__class__:
-            return self.__ident() != other.__ident()
+            return hash(self) != hash(other) or self.__ident() != other.__ident()
         else:
             return NotImplemented
 
@@ -50,6 +82,10 @@ class Type:
             value = None
         return value
 
+    def get_decoder(self):
+        """Return function which decodes a single value like :any:`decode`, specialized for speed."""
+        return self.decode
+
     def _decode(self, value):
         raise NotImplementedError(self)
 
@@ -67,6 +103,10 @@ class EnumType(Type):
     def _getargs(self):
         return (self._values,)
 
+    def get_decoder(self):
+        """Return function which decodes a single value like :any:`decode`, specialized for speed."""
+        return _decode_str
+
     def _decode(self, value):
         return value
 
@@ -84,11 +124,18 @@ class StrType(Type):
     def _getkwargs(self):
         return (("length", self.length, None),)
 
+    def get_decoder(self):
+        """Return function which decodes a single value like :any:`decode`, specialized for speed."""
+        return _decode_str
+
     def _decode(self, value):
         return value
 
 
 class HexType(Type):
+
+    memoizable = True
+
     def __init__(self, length=None):
         """`length` number of Hex Bytes."""
         self._length = length
@@ -110,6 +157,10 @@ class HexType(Type):
 
 
 class IntType(Type):
+
+    memoizable = True
+    numeric = True
+
     def __init__(self, min_, max_, divider=None):
         """Integer in the range of [min_, max_] with granularity of `1 / divider`."""
         self._min = min_
@@ -144,6 +195,13 @@ class IntType(Type):
         max_ = _try_int(self.max_ / divider)
         return IntType(min_, max_, divider=divider)
 
+    def get_decoder(self):
+        """Return function which decodes a single value like :any:`decode`, specialized for speed."""
+        if self.divider and self.divider > 0:
+            return _decode_float
+        else:
+            return _decode_int
+
     def _decode(self, value):
         if value not in ("-", ""):
             if self.divider and self.divider > 0:
@@ -155,10 +213,18 @@ class IntType(Type):
 
 
 class BoolType(Type):
+
+    memoizable = True
+    numeric = True
+
     def __init__(self):
         """Boolean Type."""
         pass
 
+    def get_decoder(self):
+        """Return function which decodes a single value like :any:`decode`, specialized for speed."""
+        return _decode_bool
+
     def _decode(self, value):
         if value != "-":
             return bool(int(value))
@@ -167,10 +233,18 @@ class BoolType(Type):
 
 
 class FloatType(Type):
+
+    memoizable = True
+    numeric = True
+
     def __init__(self):
         """Floating Type."""
         pass
 
+    def get_decoder(self):
+        """Return function which decodes a single value like :any:`decode`, specialized for speed."""
+        return _decode_float
+
     def _decode(self, value):
         if value != "-":
             return float(value)
@@ -179,18 +253,25 @@ class FloatType(Type):
 
 
 class DateType(Type):
+
+    memoizable = True
+
     def __init__(self):
         """Date Type."""
         pass
 
+    def get_decoder(self):
+        """Return function which decodes a single value like :any:`decode`, specialized for speed."""
+        return _decode_date
+
     def _decode(self, value):
-        if value != "-.-.-":
-            return datetime.datetime.strptime(value, "%d.%m.%Y").date()
-        else:
-            return None
+        return _decode_date(value)
 
 
 class TimeType(Type):
+
+    memoizable = True
+
     def __init__(self, minres=None, nosecond=False):
         """
         Time.
@@ -213,21 +294,17 @@ class TimeType(Type):
         return self._nosecond
 
     def _getkwargs(self):
-        return (("minres", self._minres, None),)
+        return (("minres", self._minres, None), ("nosecond", self._nosecond, False))
+
+    def get_decoder(self):
+        """Return function which decodes a single value like :any:`decode`, specialized for speed."""
+        return _decode_shorttime if self.nosecond else _decode_time
 
     def _decode(self, value):
         if self.nosecond:
-            if value != "-:-":
-                dt = datetime.datetime.strptime(value, "%H:%M")
-                return ShortTime(dt.hour, dt.minute)
-            else:
-                return None
+            return _decode_shorttime(value)
         else:
-            if value != "-:-:-":
-                dt = datetime.datetime.strptime(value, "%H:%M:%S")
-                return ShortTime(dt.hour, dt.minute, dt.second)
-            else:
-                return None
+            return _decode_time(value)
 
 
 class DateTimeType(Type):
@@ -250,6 +327,10 @@ class PinType(Type):
     def __init__(self):
         """Pin."""
 
+    def get_decoder(self):
+        """Return function which decodes a single value like :any:`decode`, specialized for speed."""
+        return _decode_str
+
     def _decode(self, value):
         return value
 
@@ -349,39 +430,63 @@ TYPEMAP = {
 }
 
 
+_TYPES = {}
+
+
+def intern_type(type_):
+    """
+    Return the canonical instance of `type_`.
+
+    Types are immutable, so all equal types can share one instance.
+
+    >>> intern_type(IntType(0, 100)) is intern_type(IntType(0, 100))
+    True
+    """
+    return _TYPES.setdefault(type_, type_)
+
+
+def _unpickle_type(cls, state):
+    type_ = cls.__new__(cls)
+    type_.__dict__.update(state)
+    return intern_type(type_)
+
+
 def gettype(name, divider=None):
-    """Get :any:`Type` instance for `name` with `divider`."""
-    # create missing types
-    if name not in TYPEMAP:
-        # STR       character string              Hello
-        # NTS       character string              Hello
-        if name.startswith(("STR:", "NTS:")):
-            len_ = name.split(":")[1]
-            if len_ != "*":
-                TYPEMAP[name] = StrType(int(len_))
-            else:
-                TYPEMAP[name] = StrType()
-        # HEX       hex digit string              hex octet sep by space
-        if name.startswith("HEX:"):
-            len_ = name.split(":")[1]
-            if len_ != "*":
-                TYPEMAP[name] = HexType(int(len_))
-            else:
-                TYPEMAP[name] = HexType()
-        # BI0:7     bit 0                         0...1
-        m = _RE_BIT.match(name)
-        if m:
-            width = int(m.groups()[1])
-            if width > 1:
-                TYPEMAP[name] = IntType(0, 2 ** width - 1)
-            else:
-                TYPEMAP[name] = BoolType()
-    # get type
-    type_ = TYPEMAP[name]
+    """Get interned :any:`Type` instance for `name` with `divider`."""
+    # `TYPEMAP` is never modified, so it can be read from any thread
+    type_ = TYPEMAP.get(name, None) or _createtype(name)
     # divider
     if divider:
         type_ = type_.with_divider(divider)
-    return type_
+    return intern_type(type_)
+
+
+@functools.lru_cache(maxsize=None)
+def _createtype(name):
+    # STR       character string              Hello
+    # NTS       character string              Hello
+    if name.startswith(("STR:", "NTS:")):
+        len_ = name.split(":")[1]
+        if len_ != "*":
+            return StrType(int(len_))
+        else:
+            return StrType()
+    # HEX       hex digit string              hex octet sep by space
+    if name.startswith("HEX:"):
+        len_ = name.split(":")[1]
+        if len_ != "*":
+            return HexType(int(len_))
+        else:
+            return HexType()
+    # BI0:7     bit 0                         0...1
+    m = _RE_BIT.match(name)
+    if m:
+        width = int(m.groups()[1])
+        if width > 1:
+            return IntType(0, 2 ** width - 1)
+        else:
+            return BoolType()
+    raise KeyError(name)
 
 
 class Time(datetime.time):
@@ -411,6 +516,70 @@ class Hex(int):
     __str__ = __repr__
 
 
+# Specialized decoders. Unavailable values like '-' or '' fail conversion and decode to `None` like in `Type.decode`.
+
+
+def _decode_str(value):
+    return value
+
+
+def _decode_int(value):
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _decode_float(value):
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _decode_bool(value):
+    try:
+        return bool(int(value))
+    except ValueError:
+        return None
+
+
+# Fast replacements for `strptime`. Out-of-range values are rejected by the `datetime` constructors.
+
+
+def _decode_date(value):
+    match = _RE_DATE.match(value)
+    if match:
+        day, month, year = match.groups()
+        try:
+            return datetime.date(int(year), int(month), int(day))
+        except ValueError:
+            pass
+    return None
+
+
+def _decode_time(value):
+    match = _RE_TIME.match(value)
+    if match:
+        hour, minute, second = match.groups()
+        try:
+            return ShortTime(int(hour), int(minute), int(second))
+        except ValueError:
+            pass
+    return None
+
+
+def _decode_shorttime(value):
+    match = _RE_SHORTTIME.match(value)
+    if match:
+        hour, minute = match.groups()
+        try:
+            return ShortTime(int(hour), int(minute))
+        except ValueError:
+            pass
+    return None
+
+
 def _try_int(value):
     intvalue = int(value)
     if float(value) == float(intvalue):
@@ -1,9 +1,12 @@
 import datetime
+import functools
+import sys
 
 from .msgdef import VirtFieldDef
 from .types import DateTimeType
 from .types import DateType
 from .types import TimeType
+from .types import intern_type
 from .util import repr_
 
 
@@ -20,27 +23,39 @@ def iter_virtfielddefs(fielddefs):
             if "dcfstate" in names:
                 sidx = names.index("dcfstate")
                 yield VirtFieldDef(
-                    f"+{names[didx]}+{names[tidx]}+dcfstate",
-                    DateTimeType(),
-                    lambda fields: _merge_date_time(fields[didx].value, fields[tidx].value, fields[sidx].value),
+                    sys.intern(f"+{names[didx]}+{names[tidx]}+dcfstate"),
+                    intern_type(DateTimeType()),
+                    functools.partial(_get_date_time, didx, tidx, sidx),
                 )
             else:
                 yield VirtFieldDef(
-                    f"+{names[didx]}+{names[tidx]}",
-                    DateTimeType(),
-                    lambda fields: _merge_date_time(fields[didx].value, fields[tidx].value),
+                    sys.intern(f"+{names[didx]}+{names[tidx]}"),
+                    intern_type(DateTimeType()),
+                    functools.partial(_get_date_time, didx, tidx, None),
                 )
     if len(fielddefs) > 1 and names[-1] == "sensor":
         valuedef = fielddefs[0]
         sensordef = fielddefs[-1]
         yield VirtFieldDef(
-            f"+{valuedef.name}+{sensordef.name}",
+            sys.intern(f"+{valuedef.name}+{sensordef.name}"),
             valuedef.type_,
-            lambda fields: _merge_sensor_status(fields[valuedef.idx].value, fields[sensordef.idx].value),
+            functools.partial(_get_sensor_status, valuedef.idx, sensordef.idx),
             unit=valuedef.unit,
         )
 
 
+# The functions are bound via `functools.partial`, as lambdas cannot be pickled.
+
+
+def _get_date_time(didx, tidx, sidx, fields):
+    state = fields[sidx].value if sidx is not None else None
+    return _merge_date_time(fields[didx].value, fields[tidx].value, state)
+
+
+def _get_sensor_status(vidx, sidx, fields):
+    return _merge_sensor_status(fields[vidx].value, fields[sidx].value)
+
+
 def _merge_date_time(date, time, state=None):
     if date is not None and time is not None:
         if state in (None, "valid"):
@@ -0,0 +1,32 @@
+"""
+Benchmark of date and time decoding versus `strptime`.
+
+    PYTHONPATH=. python profiling/datetypes.py [number]
+"""
+import datetime
+import sys
+import timeit
+
+from ebus.types import TYPEMAP
+
+DATA = (
+    ("BDA", "%d.%m.%Y", "24.12.2020"),
+    ("BTI", "%H:%M:%S", "13:45:07"),
+    ("BTM", "%H:%M", "13:45"),
+)
+
+
+def main(number=100000):
+    for name, format_, value in DATA:
+        decoder = TYPEMAP[name].get_decoder()
+        strptime = datetime.datetime.strptime
+        reference = min(timeit.repeat(lambda: strptime(value, format_), number=number, repeat=5))
+        duration = min(timeit.repeat(lambda: decoder(value), number=number, repeat=5))
+        print(
+            f"{name:4s} {value!r:12s} strptime {reference / number * 1e6:6.2f} us"
+            f"  decoder {duration / number * 1e6:6.2f} us  ({reference / duration:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,58 @@
+"""
+Benchmark of the listen hot path.
+
+Decodes all `tests/testdata/listen*.txt` lines repeatedly and reports the throughput.
+
+    PYTHONPATH=. python profiling/listen.py [repeat] [memosize]
+"""
+import pathlib
+import sys
+import timeit
+
+import ebus
+
+TESTDATAPATH = pathlib.Path("tests") / "testdata"
+
+DATA = (
+    ("find0.txt", "listen0a.txt"),
+    ("find0.txt", "listen0b.txt"),
+    ("find1.txt", "listen1a.txt"),
+)
+
+
+def load_msgdefs(filepath):
+    msgdefs = ebus.MsgDefs()
+    for line in filepath.read_text().splitlines():
+        if line:
+            try:
+                msgdefs.add(ebus.decode_msgdef(line))
+            except ValueError:
+                pass
+    return msgdefs
+
+
+def decode(decoder, lines, msgfilter=None):
+    for line in lines:
+        try:
+            decoder.decode_line(line, msgfilter=msgfilter)
+        except (ebus.UnknownMsgError, ValueError):
+            pass
+
+
+def main(repeat=20, memosize=None):
+    total = 0
+    for deffilename, listenfilename in DATA:
+        msgdefs = load_msgdefs(TESTDATAPATH / deffilename)
+        lines = [line for line in (TESTDATAPATH / listenfilename).read_text().splitlines() if line]
+        decoder = ebus.MsgDecoder(msgdefs, memosize=memosize)
+        duration = min(timeit.repeat(lambda: decode(decoder, lines), number=1, repeat=repeat))
+        total += duration
+        print(f"{listenfilename:16s} {len(lines):6d} lines {duration * 1e3:8.2f} ms {len(lines) / duration:10.0f} lines/s")
+        if memosize:
+            stats = decoder.memostats
+            print(f"{'':16s} memo hits {stats['hits']} misses {stats['misses']} evictions {stats['evictions']}")
+    print(f"{'total':16s} {'':12s} {total * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,43 @@
+"""
+Memory report of decoded message definitions.
+
+Decodes the largest `tests/testdata/find*.txt` catalog in a fresh interpreter and reports
+the allocated bytes per definition together with the number of distinct objects.
+
+    PYTHONPATH=. python profiling/memory.py
+"""
+import logging
+import pathlib
+import tracemalloc
+
+import ebus
+
+TESTDATAPATH = pathlib.Path("tests") / "testdata"
+
+
+def main():
+    logging.disable(logging.WARNING)
+    filepaths = [filepath for filepath in TESTDATAPATH.glob("find*.txt") if not filepath.name.endswith(".decoded.txt")]
+    filepath = max(filepaths, key=lambda filepath: filepath.stat().st_size)
+    lines = [line for line in filepath.read_text().splitlines() if line]
+
+    tracemalloc.start()
+    msgdefs = [msgdef for msgdef in ebus.decode_msgdefs(lines) if msgdef]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    fielddefs = [fielddef for msgdef in msgdefs for fielddef in msgdef.children]
+    strs = [msgdef.circuit for msgdef in msgdefs]
+    strs += [value for fielddef in fielddefs for value in (fielddef.name, fielddef.unit, fielddef.comment) if value]
+    print(f"{filepath.name}: {len(msgdefs)} definitions, {len(fielddefs)} fields")
+    print(f"  {size / len(msgdefs):10.0f} bytes per definition ({size / 2 ** 20:.2f} MiB)")
+    _objects("types", [fielddef.type_ for fielddef in fielddefs])
+    _objects("strings", strs)
+
+
+def _objects(name, objs):
+    print(f"  {name:8s} {len(objs):6d} used {len({id(obj) for obj in objs}):6d} objects {len(set(objs)):6d} distinct")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""
+Benchmark of decoding message definitions (cold startup).
+
+Decodes all `tests/testdata/find*.txt` lines.
+
+    PYTHONPATH=. python profiling/msgdefs.py [repeat]
+"""
+import pathlib
+import sys
+import timeit
+
+import ebus
+
+TESTDATAPATH = pathlib.Path("tests") / "testdata"
+
+
+def main(repeat=20):
+    for filepath in sorted(TESTDATAPATH.glob("find*.txt")):
+        if filepath.name.endswith(".decoded.txt"):
+            continue
+        lines = [line for line in filepath.read_text().splitlines() if line]
+        duration = min(timeit.repeat(lambda: ebus.decode_msgdefs(lines), number=1, repeat=repeat))
+        print(f"{filepath.name:16s} {len(lines):6d} lines {duration * 1e3:8.2f} ms {len(lines) / duration:10.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
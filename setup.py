@@ -30,7 +30,8 @@ config["classifiers"] = [
 ]
 config["keywords"] = "ebus, ebusd, ebus client"
 config["packages"] = ["ebus"]
-config["install_requires"] = ["anytree>=2.8.0"]
+config["install_requires"] = []
+config["extras_require"] = {"numpy": ["numpy"]}
 config["tests_require"] = ["nose", "pydocstyle", "pycodestyle", "black", "isort"]
 config["test_suite"] = "nose.collector"
 config["entry_points"] = {"console_scripts": ["ebustool = ebus.cli:main", "ebt = ebus.cli:main"]}
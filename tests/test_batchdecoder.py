@@ -0,0 +1,93 @@
+import math
+import unittest
+
+from nose.tools import assert_raises
+from nose.tools import eq_
+
+import ebus
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .util import TESTDATAPATH
+from .util import create_msgdefs
+from .util import load_msgdefs
+
+
+def test_numpy_missing():
+    """Numpy is required."""
+    if numpy is not None:
+        raise unittest.SkipTest("numpy is installed")
+    assert_raises(ImportError, ebus.BatchDecoder, ebus.MsgDefs())
+
+
+def test_batch():
+    """Columnar Batch."""
+    if numpy is None:
+        raise unittest.SkipTest("numpy is not installed")
+    msgdefs = create_msgdefs(
+        "r,bai,Status,temp,s,UCH,,°C,,onoff,s,UCH,0=off;1=on,,", "r,bai,Pressure,press,s,D2C,,bar,"
+    )
+    decoder = ebus.BatchDecoder(msgdefs)
+    lines = [
+        "bai Status = 40;on",
+        "bai Pressure = 1.5",
+        "bai Status = -;off",
+        "bai Unknown = 4",
+        "bai Status = no data stored",
+        "bai Status = 42",
+    ]
+    batch = decoder.decode(lines, timestamps=[10.0, 11.0, 12.0, 13.0, 14.0, 15.0])
+    eq_(batch.size, 6)
+    eq_(batch.skipped, 2)
+    eq_(sorted(batch.columns), ["bai/Pressure/press", "bai/Status/temp"])
+    temp = batch.columns["bai/Status/temp"]
+    eq_(temp.fielddef.name, "temp")
+    eq_(temp.timestamps.tolist(), [10.0, 12.0, 15.0])
+    eq_(temp.valid.tolist(), [True, False, True])
+    eq_(temp.values[temp.valid].tolist(), [40.0, 42.0])
+    eq_(math.isnan(temp.values[1]), True)
+    press = batch.columns["bai/Pressure/press"]
+    eq_(press.timestamps.tolist(), [11.0])
+    eq_(press.values.tolist(), [1.5])
+
+
+def test_listen0a():
+    """Batch decoding matches :any:`MsgDecoder`."""
+    if numpy is None:
+        raise unittest.SkipTest("numpy is not installed")
+    msgdefs = load_msgdefs(TESTDATAPATH / "find0.txt")
+    lines = (TESTDATAPATH / "listen0a.txt").read_text().splitlines()
+    batch = ebus.BatchDecoder(msgdefs).decode(lines)
+    eq_(batch.size, len(lines))
+
+    expected = {}
+    msgdecoder = ebus.MsgDecoder(msgdefs)
+    for row, line in enumerate(lines):
+        try:
+            msg = msgdecoder.decode_line(line)
+        except (ValueError, ebus.UnknownMsgError):
+            continue
+        if msg is not None:
+            for field in msg.fields:
+                if field.fielddef.idx is not None and field.fielddef.type_.numeric:
+                    expected.setdefault(field.ident, []).append((row, field.value))
+    eq_(sorted(batch.columns), sorted(expected))
+    for ident, column in batch.columns.items():
+        valid = [value not in (None, ebus.na.NA) for _, value in expected[ident]]
+        eq_(column.timestamps.tolist(), [row for row, _ in expected[ident]])
+        eq_(column.valid.tolist(), valid)
+        eq_(column.values[column.valid].tolist(), [value for (_, value), ok in zip(expected[ident], valid) if ok])
+
+
+def test_timestamps_mismatch():
+    """The number of timestamps must match the number of lines."""
+    if numpy is None:
+        raise unittest.SkipTest("numpy is not installed")
+    decoder = ebus.BatchDecoder(create_msgdefs("r,bai,Status,temp,s,UCH,,°C,"))
+    lines = ["bai Status = 40", "bai Status = 41"]
+    assert_raises(ValueError, decoder.decode, lines, timestamps=[10.0])
+    assert_raises(ValueError, decoder.decode, lines, timestamps=[10.0, 11.0, 12.0])
+    eq_(decoder.decode(lines, timestamps=[10.0, 11.0]).size, 2)
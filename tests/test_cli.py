@@ -1,9 +1,21 @@
 from nose.tools import assert_raises
+from nose.tools import eq_
 
 import ebus
+from ebus.cli.common import format_field
+
+from .util import create_msgdefs
 
 
 def test_noargs():
     """No Arguments."""
     with assert_raises(SystemExit):
         ebus.cli.argvhandler([])
+
+
+def test_format_field():
+    """Fields are formatted with the type of the resolved message definition."""
+    msgdefs = create_msgdefs("r,bai,Status,temp,s,UCH,,°C,", "w,bai,Status,temp,s,UCH,,°C,")
+    msgdef = list(msgdefs.resolve(["bai/Status#3"]))[0]
+    msg = ebus.Msg(msgdef, (ebus.Field(msgdef.children[0], 40),))
+    eq_(format_field(msg, msg.fields[0]), f"{'bai/Status/temp':<40s} r3w- 40°C")
@@ -117,3 +117,25 @@ def test_command_error():
             await c.readline()
 
     run(test, server=s)
+
+
+def test_pipeline():
+    """Pipelined Commands."""
+    s = DummyServer()
+    c = ebus.Connection(port=s.port, autoconnect=True)
+    s.add_rx("rx0\n")
+    s.add_rx("rx1\n")
+    s.add_rx("rx2\n")
+    s.add_tx("tx0\n\n")
+    s.add_tx("ERR: msg\n\n")
+    s.add_tx("tx2a\ntx2b\n\n")
+
+    async def test():
+        await s.start()
+        responses = [response async for response in c.pipeline(["rx0", "rx1", "rx2"], check=True)]
+        eq_(len(responses), 3)
+        eq_(responses[0], ("tx0", ""))
+        eq_(repr(responses[1]), "CommandError('msg')")
+        eq_(responses[2], ("tx2a", "tx2b", ""))
+
+    run(test, server=s)
@@ -0,0 +1,105 @@
+import asyncio
+
+from nose.tools import assert_raises
+from nose.tools import eq_
+
+import ebus
+
+from .util import DummyServer
+from .util import run
+
+
+def test_connectionpool():
+    """ConnectionPool Class Properties."""
+    p = ebus.ConnectionPool()
+    eq_(p.host, "127.0.0.1")
+    eq_(p.port, 8888)
+    eq_(p.size, 1)
+    eq_(p.timeout, None)
+    eq_(repr(p), "ConnectionPool()")
+
+    p = ebus.ConnectionPool(host="foo", port=4444, size=3, timeout=5)
+    eq_(p.size, 3)
+    eq_(len(p.connections), 3)
+    eq_(all(c.autoconnect for c in p.connections), True)
+    eq_(repr(p), "ConnectionPool(host='foo', port=4444, size=3, timeout=5)")
+
+    with assert_raises(ValueError):
+        ebus.ConnectionPool(size=0)
+
+
+def test_acquire():
+    """Acquire waits for idle connection."""
+    p = ebus.ConnectionPool(size=2)
+
+    async def test():
+        async with p.acquire() as c0:
+            async with p.acquire() as c1:
+                eq_(c0 is c1, False)
+                waiter = asyncio.ensure_future(_acquire(p))
+                await asyncio.sleep(0.001)
+                eq_(waiter.done(), False)
+            await asyncio.sleep(0.001)
+            eq_(waiter.done(), True)
+            eq_(waiter.result() is c1, True)
+
+    run(test)
+
+
+def test_acquire_urgent():
+    """Urgent requests get the next idle connection before all other waiting requests."""
+    p = ebus.ConnectionPool(size=1)
+    order = []
+
+    async def acquire(name, urgent=False):
+        async with p.acquire(urgent=urgent):
+            order.append(name)
+            await asyncio.sleep(0.001)
+
+    async def test():
+        async with p.acquire():
+            waiters = [asyncio.ensure_future(acquire(f"read{idx}")) for idx in range(3)]
+            await asyncio.sleep(0.001)
+            cancelled = asyncio.ensure_future(acquire("cancelled", urgent=True))
+            waiters.append(asyncio.ensure_future(acquire("write", urgent=True)))
+            await asyncio.sleep(0.001)
+            cancelled.cancel()
+        await asyncio.gather(*waiters)
+        eq_(order, ["write", "read0", "read1", "read2"])
+        # the connection is idle again
+        eq_(await _acquire(p) is p.connections[0], True)
+
+        # a waiter cancelled after the hand over returns the connection
+        async with p.acquire():
+            waiter = asyncio.ensure_future(_acquire(p))
+            await asyncio.sleep(0.001)
+        waiter.cancel()
+        await asyncio.sleep(0.001)
+        eq_(waiter.cancelled(), True)
+        eq_(await asyncio.wait_for(_acquire(p), 1) is p.connections[0], True)
+
+    run(test)
+
+
+def test_request():
+    """Request through pool."""
+    s = DummyServer()
+    p = ebus.ConnectionPool(port=s.port)
+    s.add_rx("rx0\n")
+    s.add_tx("tx0\n\n")
+
+    async def test():
+        await s.start()
+        async with p.acquire() as c:
+            await c.write("rx0")
+            lines = tuple([line async for line in c.readlines()])
+        eq_(lines, ("tx0", ""))
+        await p.disconnect()
+        eq_(c.is_connected(), False)
+
+    run(test, server=s)
+
+
+async def _acquire(pool):
+    async with pool.acquire() as connection:
+        return connection
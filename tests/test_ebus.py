@@ -1,9 +1,13 @@
 import asyncio
+import concurrent.futures
+import copy
+import time
 
 from nose.tools import eq_
 
 import ebus
 
+from .util import TESTDATAPATH
 from .util import DummyServer
 from .util import run
 
@@ -43,3 +47,554 @@ def test_cmd():
         eq_(lines, ("line0", "line1", ""))
 
     run(test, server=s)
+
+
+def test_poolsize():
+    """Pool Size."""
+    e = ebus.Ebus("host", 4444, poolsize=3)
+    eq_(e.poolsize, 3)
+    eq_(e.pool.size, 3)
+    eq_(e.connection in e.pool.connections, False)
+
+    eq_(repr(e), "Ebus('host', 4444, poolsize=3)")
+    eq_(copy.copy(e).poolsize, 3)
+
+
+def test_read_many():
+    """Read Many."""
+    s = DummyServer()
+    fielddef = ebus.FieldDef(0, "temp", ebus.types.IntType(0, 254), "°C")
+    msgdef0 = ebus.MsgDef("bai", "Temp0", (fielddef,), read=True)
+    msgdef1 = ebus.MsgDef("bai", "Temp1", (copy.copy(fielddef),), read=True)
+    msgdef2 = ebus.MsgDef("bai", "Temp2", (copy.copy(fielddef),), write=True)
+
+    async def test():
+        await s.start()
+        s.add_rx("read -c bai Temp0\n")
+        s.add_tx("45\n\n")
+        s.add_rx("read -c bai Temp1\n")
+        s.add_tx("ERR: element not found\n\n")
+
+        e = ebus.Ebus(s.LOCALHOST, s.port)
+        msgs = [msg async for msg in e.read_many([msgdef0, msgdef1, msgdef2])]
+        eq_(len(msgs), 2)
+        eq_(msgs[0], ebus.Msg(msgdef0, (ebus.Field(msgdef0.children[0], 45),)))
+        eq_(msgs[1].msgdef, msgdef1)
+        eq_(repr(msgs[1].error), "CommandError('element not found')")
+        eq_(msgs[1].fields, ())
+
+    run(test, server=s)
+
+
+def test_read_many_pipelined():
+    """Read Many Pipelined."""
+    s = DummyServer()
+    fielddef = ebus.FieldDef(0, "temp", ebus.types.IntType(0, 254), "°C")
+    msgdef0 = ebus.MsgDef("bai", "Temp0", (fielddef,), read=True)
+    msgdef1 = ebus.MsgDef("bai", "Temp1", (copy.copy(fielddef),), read=True)
+    msgdef2 = ebus.MsgDef("bai", "Temp2", (copy.copy(fielddef),), read=True, prio=2)
+
+    async def test():
+        await s.start()
+        s.add_rx("read -c bai -m 10 Temp0\n")
+        s.add_rx("read -c bai -m 10 Temp1\n")
+        s.add_tx("45\n\n")
+        s.add_tx("ERR: element not found\n\n")
+        s.add_rx("read -c bai -p 2 -m 10 Temp2\n")
+        s.add_tx("47\n\n")
+
+        e = ebus.Ebus(s.LOCALHOST, s.port)
+        msgs = [msg async for msg in e.read_many([msgdef0, msgdef1, msgdef2], prio=True, ttl=10, depth=2)]
+        eq_(len(msgs), 3)
+        eq_(msgs[0], ebus.Msg(msgdef0, (ebus.Field(msgdef0.children[0], 45),)))
+        eq_(msgs[1], ebus.BrokenMsg(msgdef1, msgs[1].error))
+        eq_(msgs[2], ebus.Msg(msgdef2, (ebus.Field(msgdef2.children[0], 47),)))
+
+    run(test, server=s)
+
+
+def test_read_coalesced():
+    """Identical concurrent reads share one request."""
+    s = DummyServer()
+    fielddef = ebus.FieldDef(0, "temp", ebus.types.IntType(0, 254), "°C")
+    msgdef = ebus.MsgDef("bai", "Temp0", (fielddef,), read=True)
+
+    async def test():
+        await s.start()
+        s.add_rx("read -c bai -m 5 Temp0\n")
+        s.add_tx("45\n\n")
+
+        e = ebus.Ebus(s.LOCALHOST, s.port)
+        msgs = await asyncio.gather(*[e.read(msgdef, ttl=5) for _ in range(3)])
+        eq_(msgs, [ebus.Msg(msgdef, (ebus.Field(fielddef, 45),))] * 3)
+        eq_(msgs[0] is msgs[1], True)
+        eq_(e.singleflight.stats, {"calls": 1, "coalesced": 2})
+
+    run(test, server=s)
+
+
+def test_read_cached():
+    """Reads are answered from cache."""
+    s = DummyServer()
+    fielddef0 = ebus.FieldDef(0, "temp", ebus.types.IntType(0, 254), "°C", "comment")
+    fielddef1 = ebus.FieldDef(1, "status", ebus.types.StrType())
+    msgdef = ebus.MsgDef("bai", "Temp0", (fielddef0, fielddef1), read=True)
+    msgdefs = ebus.MsgDefs()
+    msgdefs.add(msgdef)
+    submsgdef = ebus.MsgDef("bai", "Temp0", (copy.copy(fielddef0),), read=True)
+
+    async def test():
+        await s.start()
+        s.add_rx("read -c bai -m 5 Temp0\n")
+        s.add_tx("45;ok\n\n")
+
+        e = ebus.Ebus(s.LOCALHOST, s.port, msgdefs=msgdefs, cache=ebus.MsgCache())
+        msg = ebus.Msg(submsgdef, (ebus.Field(fielddef0, 45),))
+        eq_(await e.read(submsgdef, ttl=5), msg)
+        eq_(await e.read(submsgdef, ttl=5), msg)
+        eq_(await e.read(msgdef, ttl=5), ebus.Msg(msgdef, (ebus.Field(fielddef0, 45), ebus.Field(fielddef1, "ok"))))
+        eq_(e.cache.stats, {"hits": 2, "misses": 1, "evictions": 0})
+
+    run(test, server=s)
+
+
+def test_listen_cached():
+    """Listen just decodes the selected fields, lazy on access, while the cache gets the complete message."""
+    s = DummyServer()
+    msgdefs = ebus.MsgDefs()
+    msgdefs.add(ebus.decode_msgdef("r,bai,Status,temp,s,UCH,,°C,,press,s,UCH,,,"))
+    submsgdefs = tuple(msgdefs.resolve(["bai/Status/temp"]))
+
+    async def test():
+        await s.start()
+        s.add_rx("listen\n")
+        s.add_tx("listen started\n")
+        s.add_tx("bai Status = 40;1\n")
+        s.add_rx("listen\n")
+        s.add_tx("listen started\n")
+        s.add_tx("bai Status = 41;2\n")
+
+        e = ebus.Ebus(s.LOCALHOST, s.port, msgdefs=msgdefs, cache=ebus.MsgCache())
+        e.msgdecoder = ebus.MsgDecoder(msgdefs, memosize=16)
+        async for msg in e.listen(msgdefs=submsgdefs):
+            break
+        eq_([(field.fielddef.name, field.value) for field in msg.fields], [("temp", 40)])
+        eq_(e.msgdecoder.memostats["misses"], 1)
+        eq_([field.value for field in e.cache.get("bai/Status", 60).fields], [40, 1])
+
+        # lazy messages are not decoded before access, neither for the cache
+        async for msg in e.listen(msgdefs=submsgdefs, lazy=True):
+            break
+        eq_(e.msgdecoder.memostats["misses"], 2)
+        eq_([(field.fielddef.name, field.value) for field in msg.fields], [("temp", 41)])
+        eq_(e.msgdecoder.memostats["misses"], 3)
+        eq_([field.value for field in e.cache.get("bai/Status", 60).fields], [41, 2])
+
+    run(test, server=s)
+
+
+def test_write_cached():
+    """Write drops the cached message."""
+    s = DummyServer()
+    fielddef0 = ebus.FieldDef(0, "temp", ebus.types.IntType(0, 254), "°C")
+    fielddef1 = copy.copy(fielddef0)
+    msgdef0 = ebus.MsgDef("bai", "Temp0", (fielddef0,), read=True, write=True)
+    msgdef1 = ebus.MsgDef("bai", "Temp1", (fielddef1,), read=True, write=True)
+    msgdefs = ebus.MsgDefs()
+    msgdefs.add(msgdef0)
+    msgdefs.add(msgdef1)
+
+    async def test():
+        await s.start()
+        s.add_rx("read -c bai -m 60 Temp0\n")
+        s.add_tx("40\n\n")
+        s.add_rx("write -c bai Temp0 41\n")
+        s.add_tx("done\n\n")
+        s.add_rx("read -c bai -m 60 Temp0\n")
+        s.add_tx("41\n\n")
+        # pipelined
+        s.add_rx("read -c bai -m 60 Temp1\n")
+        s.add_tx("50\n\n")
+        s.add_rx("write -c bai Temp0 42\n")
+        s.add_tx("done\n\n")
+        s.add_rx("write -c bai Temp1 51\n")
+        s.add_tx("done\n\n")
+        s.add_rx("read -c bai -m 60 Temp0\n")
+        s.add_rx("read -c bai -m 60 Temp1\n")
+        s.add_tx("42\n\n")
+        s.add_tx("51\n\n")
+
+        e = ebus.Ebus(s.LOCALHOST, s.port, msgdefs=msgdefs, cache=ebus.MsgCache())
+        eq_(await e.read(msgdef0, ttl=60), ebus.Msg(msgdef0, (ebus.Field(fielddef0, 40),)))
+        await e.write(msgdef0, 41)
+        eq_(len(e.cache), 0)
+        eq_(await e.read(msgdef0, ttl=60), ebus.Msg(msgdef0, (ebus.Field(fielddef0, 41),)))
+        eq_(await e.read(msgdef0, ttl=60), ebus.Msg(msgdef0, (ebus.Field(fielddef0, 41),)))
+        eq_(e.cache.stats, {"hits": 1, "misses": 2, "evictions": 0})
+
+        msgs = [msg async for msg in e.read_many([msgdef0, msgdef1], ttl=60, depth=2)]
+        eq_(msgs, [ebus.Msg(msgdef0, (ebus.Field(fielddef0, 41),)), ebus.Msg(msgdef1, (ebus.Field(fielddef1, 50),))])
+        await e.write(msgdef0, 42)
+        await e.write(msgdef1, 51)
+        eq_(len(e.cache), 0)
+        msgs = [msg async for msg in e.read_many([msgdef0, msgdef1], ttl=60, depth=2)]
+        eq_(msgs, [ebus.Msg(msgdef0, (ebus.Field(fielddef0, 42),)), ebus.Msg(msgdef1, (ebus.Field(fielddef1, 51),))])
+        eq_(len(e.cache), 2)
+
+    run(test, server=s)
+
+
+def test_poll():
+    """Poll according to priority."""
+    s = DummyServer()
+    fielddef = ebus.FieldDef(0, "temp", ebus.types.IntType(0, 254), "°C")
+    msgdef0 = ebus.MsgDef("bai", "Temp0", (fielddef,), read=True)
+    msgdef1 = ebus.MsgDef("bai", "Temp1", (copy.copy(fielddef),), read=True, prio=3)
+    msgdef2 = ebus.MsgDef("bai", "Temp2", (copy.copy(fielddef),), write=True)
+
+    async def test():
+        await s.start()
+        s.add_rx("read -c bai -m 0 Temp0\n")
+        s.add_tx("40\n\n")
+        s.add_rx("read -c bai -m 0 Temp1\n")
+        s.add_tx("41\n\n")
+        s.add_rx("read -c bai -m 0 Temp0\n")
+        s.add_tx("42\n\n")
+        # EBUSD may answer with data up to half of the poll period old
+        s.add_rx("read -c bai -m 2 Temp0\n")
+        s.add_tx("43\n\n")
+        s.add_rx("read -c bai -m 7 Temp1\n")
+        s.add_tx("44\n\n")
+
+        e = ebus.Ebus(s.LOCALHOST, s.port)
+        msgs = []
+        async for msg in e.poll([msgdef0, msgdef1, msgdef2], interval=0.05):
+            msgs.append(msg)
+            if len(msgs) == 3:
+                break
+        eq_([(msg.msgdef.name, msg.fields[0].value) for msg in msgs], [("Temp0", 40), ("Temp1", 41), ("Temp0", 42)])
+
+        msgs = []
+        async for msg in e.poll([msgdef0, msgdef1, msgdef2], interval=5):
+            msgs.append(msg)
+            if len(msgs) == 2:
+                break
+        eq_([(msg.msgdef.name, msg.fields[0].value) for msg in msgs], [("Temp0", 43), ("Temp1", 44)])
+
+    run(test, server=s)
+
+
+def test_poll_cached():
+    """Polls are not answered from cache."""
+    s = DummyServer()
+    fielddef = ebus.FieldDef(0, "temp", ebus.types.IntType(0, 254), "°C")
+    msgdef = ebus.MsgDef("bai", "Temp0", (fielddef,), read=True)
+
+    async def test():
+        await s.start()
+        s.add_rx("read -c bai -m 0 Temp0\n")
+        s.add_tx("40\n\n")
+        s.add_rx("read -c bai -m 0 Temp0\n")
+        s.add_tx("41\n\n")
+
+        e = ebus.Ebus(s.LOCALHOST, s.port, cache=ebus.MsgCache())
+        msgs = []
+        async for msg in e.poll([msgdef], interval=1):
+            msgs.append(msg)
+            if len(msgs) == 2:
+                break
+        eq_([msg.fields[0].value for msg in msgs], [40, 41])
+        eq_(e.cache.stats["hits"], 0)
+        eq_(len(e.cache), 1)
+
+    run(test, server=s)
+
+
+def test_ratelimiter():
+    """Reads are throttled, writes are preferred."""
+    s = DummyServer()
+    fielddef = ebus.FieldDef(0, "temp", ebus.types.IntType(0, 254), "°C")
+    msgdef0 = ebus.MsgDef("bai", "Temp0", (fielddef,), read=True)
+    msgdef1 = ebus.MsgDef("bai", "Temp1", (copy.copy(fielddef),), read=True)
+    msgdef2 = ebus.MsgDef("bai", "Temp2", (copy.copy(fielddef),), write=True)
+    msgdefs = ebus.MsgDefs()
+    for msgdef in (msgdef0, msgdef1, msgdef2):
+        msgdefs.add(msgdef)
+
+    async def test():
+        await s.start()
+        # read
+        s.add_rx("read -c bai Temp0\n")
+        s.add_tx("40\n\n")
+        # read_many
+        s.add_rx("read -c bai Temp0\n")
+        s.add_tx("41\n\n")
+        s.add_rx("read -c bai Temp1\n")
+        s.add_tx("42\n\n")
+        # pipelined
+        s.add_rx("read -c bai Temp0\n")
+        s.add_rx("read -c bai Temp1\n")
+        s.add_tx("43\n\n")
+        s.add_tx("44\n\n")
+        # write overtakes waiting reads
+        s.add_rx("write -c bai Temp2 5\n")
+        s.add_tx("done\n\n")
+        s.add_rx("read -c bai Temp0\n")
+        s.add_tx("45\n\n")
+        s.add_rx("read -c bai Temp1\n")
+        s.add_tx("46\n\n")
+
+        r = ebus.RateLimiter(rate=20)
+        e = ebus.Ebus(s.LOCALHOST, s.port, msgdefs=msgdefs, ratelimiter=r)
+        start = time.monotonic()
+        eq_((await e.read(msgdef0)).fields[0].value, 40)
+        msgs = [msg async for msg in e.read_many([msgdef0, msgdef1])]
+        eq_([msg.fields[0].value for msg in msgs], [41, 42])
+        msgs = [msg async for msg in e.read_many([msgdef0, msgdef1], depth=2)]
+        eq_([msg.fields[0].value for msg in msgs], [43, 44])
+        # 5 commands at 20 commands per second
+        eq_(time.monotonic() - start >= 0.19, True)
+        eq_((r.stats["requests"], r.stats["delayed"]), (5, 4))
+
+        order = []
+
+        async def read(msgdef):
+            order.append((await e.read(msgdef)).fields[0].value)
+
+        async def write():
+            await e.write(msgdef2, 5)
+            order.append("write")
+
+        reads = [asyncio.ensure_future(read(msgdef0)), asyncio.ensure_future(read(msgdef1))]
+        await asyncio.sleep(0)
+        await asyncio.gather(write(), *reads)
+        eq_(order, ["write", 45, 46])
+        eq_((r.stats["requests"], r.stats["delayed"]), (8, 7))
+
+    run(test, server=s)
+
+
+def test_write_urgent():
+    """Writes get the next idle connection before waiting reads."""
+    s = DummyServer()
+    fielddef = ebus.FieldDef(0, "temp", ebus.types.IntType(0, 254), "°C")
+    msgdefs = ebus.MsgDefs()
+    for name in ("Temp0", "Temp1", "Temp2"):
+        msgdefs.add(ebus.MsgDef("bai", name, (copy.copy(fielddef),), read=True))
+    msgdefs.add(ebus.MsgDef("bai", "Temp3", (copy.copy(fielddef),), write=True))
+
+    async def test():
+        await s.start()
+        s.add_rx("read -c bai Temp0\n")
+        s.add_tx("40\n\n")
+        s.add_rx("write -c bai Temp3 5\n")
+        s.add_tx("done\n\n")
+        s.add_rx("read -c bai Temp1\n")
+        s.add_tx("41\n\n")
+        s.add_rx("read -c bai Temp2\n")
+        s.add_tx("42\n\n")
+
+        e = ebus.Ebus(s.LOCALHOST, s.port, msgdefs=msgdefs)
+        order = []
+
+        async def read(name):
+            order.append((await e.read(msgdefs.get("bai", name))).fields[0].value)
+
+        async def write():
+            await e.write(msgdefs.get("bai", "Temp3"), 5)
+            order.append("write")
+
+        # all reads wait for the one connection
+        reads = [asyncio.ensure_future(read(name)) for name in ("Temp0", "Temp1", "Temp2")]
+        await asyncio.sleep(0)
+        await asyncio.gather(write(), *reads)
+        eq_(order, [40, "write", 41, 42])
+
+    run(test, server=s)
+
+
+def test_load_msgdefs():
+    """Incremental Load of Message Definitions."""
+    s = DummyServer()
+
+    async def test():
+        await s.start()
+        s.add_rx("find -a -F type,circuit,name,fields\n")
+        s.add_tx("r,bai,Status,temp,s,UCH,,°C,\nr,mc,Temp,temp,s,UCH,,°C,\nr,scan.08,Id,,s,STR:*,,,\n\n")
+        s.add_rx("find -a -F type,circuit,name,fields\n")
+        s.add_tx("r,bai,Status,temp,s,UCH,,°C,\nr,hc,Temp,temp,s,UCH,,°C,\nw,bai,Status,temp,s,UCH,,°C,\n\n")
+        s.add_rx("find -a -F type,circuit,name,fields\n")
+        s.add_tx("r,bai,Status,temp,s,UCH,,°C,\nw,bai,Status,temp,s,UCH,,°C,\n\n")
+
+        e = ebus.Ebus(s.LOCALHOST, s.port)
+        diff = await e.load_msgdefs()
+        eq_([msgdef.ident for msgdef in diff.added], ["bai/Status", "mc/Temp"])
+        eq_(diff.removed, ())
+        eq_(diff.changed, ())
+        status = e.msgdefs.get("bai", "Status")
+        field = status.children[0]
+        snapshot = e.msgdefs
+        eq_(isinstance(snapshot, ebus.FrozenMsgDefs), True)
+
+        diff = await e.load_msgdefs()
+        eq_(e.msgdefs is snapshot, False)
+        eq_(snapshot.summary(), "2 messages (2 read, 0 update, 0 write) with 2 fields")
+        eq_([msgdef.ident for msgdef in diff.added], ["hc/Temp"])
+        eq_([msgdef.ident for msgdef in diff.removed], ["mc/Temp"])
+        eq_([msgdef.ident for msgdef in diff.changed], ["bai/Status"])
+        eq_(e.msgdefs.get("bai", "Status").type_, "r-w-")
+        eq_(e.msgdefs.get("bai", "Status").fields, status.fields)
+        eq_(e.msgdefs.summary(), "2 messages (2 read, 0 update, 1 write) with 2 fields")
+
+        # reloads never modify a published snapshot
+        eq_(snapshot.get("bai", "Status") is status, True)
+        eq_(field.msgdef is status, True)
+        eq_(field.msgdef.type_, "r---")
+        eq_(field.ident, "bai/Status/temp")
+
+        joined = e.msgdefs.get("bai", "Status")
+        joinedfield = joined.children[0]
+        snapshot = e.msgdefs
+        await e.load_msgdefs()
+        eq_(snapshot.get("bai", "Status") is joined, True)
+        eq_(joinedfield.msgdef is joined, True)
+        eq_(joinedfield.ident, "bai/Status/temp")
+        eq_(field.msgdef is status, True)
+
+    run(test, server=s)
+
+
+def test_load_msgdefs_executor():
+    """Decode Message Definitions in an executor."""
+    lines = [line for line in (TESTDATAPATH / "find1.txt").read_text().splitlines() if line]
+
+    async def load(executor=None, chunksize=256):
+        s = DummyServer()
+        await s.start()
+        s.add_rx("find -a -F type,circuit,name,fields\n")
+        s.add_tx("".join(f"{line}\n" for line in lines) + "\n")
+        e = ebus.Ebus(s.LOCALHOST, s.port)
+        await e.load_msgdefs(executor=executor, chunksize=chunksize)
+        await s.terminate()
+        return list(e.msgdefs)
+
+    async def test():
+        ref = await load()
+        eq_(len(ref), 408)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            eq_(await load(executor=executor, chunksize=50), ref)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+            eq_(await load(executor=executor, chunksize=100), ref)
+
+    run(test)
+
+
+_INFO = """version: ebusd 3.4.v3.4
+signal: acquired
+masters: 3
+messages: {cnt}
+address 03: master #11
+address 08: slave #11, scanned "MF=Vaillant;ID=BAI00;SW=0204;HW=9602", loaded "vaillant/08.bai.csv"
+address 15: slave #2{scanned}
+address 31: master #8, ebusd
+address 36: slave #8, ebusd
+
+"""
+
+
+def test_wait_scancompleted():
+    """Wait for scan completion via info."""
+    s = DummyServer()
+
+    async def test():
+        await s.start()
+        for cnt, scanned in ((100, ""), (200, ', scanned "MF=Vaillant;ID=UI"'), (200, ', scanned "MF=Vaillant;ID=UI"')):
+            s.add_rx("info\n")
+            s.add_tx(_INFO.format(cnt=cnt, scanned=scanned))
+
+        e = ebus.Ebus(s.LOCALHOST, s.port, scanwaitinterval=0.001)
+        eq_([cnt async for cnt in e.wait_scancompleted()], [100, 200])
+
+    run(test, server=s)
+
+
+def test_wait_scancompleted_unscanned():
+    """Wait for scan completion with slave never answering."""
+    s = DummyServer()
+
+    async def test():
+        await s.start()
+        for cnt in (100, 200, 200, 200, 200):
+            s.add_rx("info\n")
+            s.add_tx(_INFO.format(cnt=cnt, scanned=""))
+
+        e = ebus.Ebus(s.LOCALHOST, s.port, scanwaitinterval=0.001)
+        eq_([cnt async for cnt in e.wait_scancompleted()], [100, 200, 200, 200])
+
+    run(test, server=s)
+
+
+def test_wait_scancompleted_find():
+    """Wait for scan completion without message count."""
+    s = DummyServer()
+
+    async def test():
+        await s.start()
+        for cnt in (1, 2, 2, 2, 2):
+            s.add_rx("info\n")
+            s.add_tx("version: ebusd 3.0\n\n")
+            s.add_rx("find -a -F type,circuit,name,fields\n")
+            s.add_tx("r,bai,Status,temp,s,UCH,,°C,\n" * cnt + "\n")
+
+        e = ebus.Ebus(s.LOCALHOST, s.port, scanwaitinterval=0.001)
+        eq_([cnt async for cnt in e.wait_scancompleted()], [2, 3, 3, 3])
+
+    run(test, server=s)
+
+
+def test_listen_dedup():
+    """Listen skips unchanged values."""
+    s = DummyServer()
+    msgdefs = ebus.MsgDefs()
+    msgdefs.add(ebus.decode_msgdef("r,bai,Temp,temp,s,UCH,,°C,"))
+    msgdefs.add(ebus.decode_msgdef("r,mc,Temp,temp,s,UCH,,°C,"))
+
+    async def test():
+        await s.start()
+        for heartbeat in (None, 0):
+            s.add_rx("listen\n")
+            s.add_tx("listen started\n")
+            for line in ("bai Temp = 40", "bai Temp = 40", "mc Temp = 40", "bai Temp = 41", "bai Temp = 41"):
+                s.add_tx(f"{line}\n")
+            s.add_tx("mc Temp = 40\n")
+            s.add_tx("mc Temp = 42\n")
+        s.add_rx("listen\n")
+        s.add_tx("listen started\n")
+        for line in ("bai Temp = 40", "bai Temp = 40", "mc Temp = 42"):
+            s.add_tx(f"{line}\n")
+
+        e = ebus.Ebus(s.LOCALHOST, s.port, msgdefs=msgdefs)
+        values = []
+        async for msg in e.listen(dedup=True):
+            values.append((msg.msgdef.circuit, msg.fields[0].value))
+            if msg.fields[0].value == 42:
+                break
+        eq_(values, [("bai", 40), ("mc", 40), ("bai", 41), ("mc", 42)])
+
+        values = []
+        async for msg in e.listen(dedup=True, heartbeat=0):
+            values.append((msg.msgdef.circuit, msg.fields[0].value))
+            if msg.fields[0].value == 42:
+                break
+        eq_(len(values), 7)
+
+        # a new snapshot with the same generation resets the deduplication
+        values = []
+        async for msg in e.listen(dedup=True):
+            values.append((msg.msgdef.circuit, msg.fields[0].value))
+            e.msgdefs = msgdefs.freeze()
+            if msg.fields[0].value == 42:
+                break
+        eq_(values, [("bai", 40), ("bai", 40), ("mc", 42)])
+
+    run(test, server=s)
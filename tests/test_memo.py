@@ -0,0 +1,29 @@
+from nose.tools import assert_raises
+from nose.tools import eq_
+
+import ebus
+
+
+def test_memo():
+    """Memoization."""
+    calls = []
+
+    def func(value):
+        calls.append(value)
+        return int(value)
+
+    memo = ebus.Memo(func, maxsize=2)
+    eq_(memo.maxsize, 2)
+    eq_(memo.hitrate, 0.0)
+    eq_([memo(value) for value in ("1", "2", "1", "1", "3", "2")], [1, 2, 1, 1, 3, 2])
+    # '2' was least recently used on arrival of '3'
+    eq_(calls, ["1", "2", "3", "2"])
+    eq_(memo.stats, {"hits": 2, "misses": 4, "evictions": 2})
+    eq_(memo.hitrate, 2 / 6)
+    eq_(len(memo), 2)
+
+    memo.clear()
+    eq_(len(memo), 0)
+
+    with assert_raises(ValueError):
+        ebus.Memo(func, maxsize=0)
@@ -1,3 +1,4 @@
+import copy
 import sys
 
 from nose.tools import eq_
@@ -41,3 +42,72 @@ def test_filter_msg():
     eq_(ebus.msg.filter_msg(msg5, [msgdef01]), None)  # not in
     eq_(ebus.msg.filter_msg(msg01, [msgdef5, msgdef01]), msg01)  # in
     eq_(ebus.msg.filter_msg(msg01, [msgdef5, msgdef0]), msg0)  # strip
+
+
+def test_msgfilter():
+    """Compiled Message Filter."""
+    fielddef0 = ebus.FieldDef(0, "uname.0", ebus.types.Type(), "unit", "comment")
+    fielddef1 = ebus.FieldDef(1, "uname.1", ebus.types.Type(), "unit")
+    fielddef5 = ebus.FieldDef(0, "uname", ebus.types.Type(), "unit")
+    msgdef01 = ebus.MsgDef("circuit0", "name", (fielddef0, fielddef1), True, 5, False, False)
+    msgdef0 = ebus.MsgDef("circuit0", "name", (copy.copy(fielddef0),), True, 5, False, False)
+    msgdef5 = ebus.MsgDef("circuit5", "name", (fielddef5,), True, 5, False, False)
+
+    field0 = ebus.Field(fielddef0, "4")
+    field1 = ebus.Field(fielddef1, "5")
+    msg01 = ebus.Msg(msgdef01, (field0, field1))
+    msg5 = ebus.Msg(msgdef5, (ebus.Field(fielddef5, "5"),))
+
+    msgfilter = ebus.MsgFilter([msgdef0])
+    eq_(len(msgfilter), 1)
+    eq_(msgfilter.get("circuit0/name"), msgdef0)
+    eq_(msgfilter.get("circuit5/name"), None)
+    eq_(msgfilter(msg5), None)
+    eq_(msgfilter(msg01), ebus.Msg(msgdef0, (field0,)))
+
+    msgfilter = ebus.MsgFilter([msgdef5, msgdef01, msgdef0])
+    eq_(len(msgfilter), 2)
+    eq_(msgfilter(msg01) is msg01, True)
+    eq_(msgfilter(msg5) is msg5, True)
+
+
+def test_lazymsg():
+    """Lazy Message decodes on first access."""
+    msgdefs = ebus.MsgDefs()
+    msgdefs.add(ebus.decode_msgdef("r,bai,Status,temp,s,UCH,,°C,,mode,s,STR:*,,,"))
+    decoder = ebus.MsgDecoder(msgdefs)
+    msg = decoder.decode_line("bai Status = 21;on")
+
+    calls = []
+
+    def decodefields(valuestr):
+        calls.append(valuestr)
+        return tuple(ebus.LazyField(field.fielddef, _record, (calls, field.value)) for field in msg.fields)
+
+    lazymsg = ebus.LazyMsg(msg.msgdef, "21;on", decodefields)
+    eq_(lazymsg.ident, "bai/Status")
+    eq_(lazymsg.valuestr, "21;on")
+    eq_(calls, [])
+    field = lazymsg.fields[0]
+    eq_(calls, ["21;on"])
+    eq_(field.unitvalue, "21°C")
+    eq_(field.value, 21)
+    eq_(calls, ["21;on", 21])
+    eq_(field.ident, "bai/Status/temp")
+    eq_(repr(field), "LazyField('temp', 21)")
+    eq_(repr(lazymsg), "LazyMsg('Status', (LazyField('temp', 21), LazyField('mode', 'on')))")
+
+    eq_(lazymsg, msg)
+    eq_(msg, lazymsg)
+    eq_(hash(lazymsg), hash(msg))
+    eq_(lazymsg.fields, msg.fields)
+    eq_(tuple(lazymsg), tuple(msg))
+    eq_(lazymsg != msg, False)
+    eq_(decoder.decode_line("bai Status = 21;on", lazy=True), msg)
+    eq_(decoder.decode_line("bai Status = 22;on", lazy=True) != msg, True)
+
+
+def _record(arg):
+    calls, value = arg
+    calls.append(value)
+    return value
@@ -0,0 +1,37 @@
+from nose.tools import assert_raises
+from nose.tools import eq_
+
+import ebus
+
+
+def _msg(name):
+    return ebus.Msg(ebus.MsgDef("bai", name, ()), ())
+
+
+def test_msgcache():
+    """Message Cache."""
+    cache = ebus.MsgCache(maxsize=2)
+    eq_(repr(cache), "MsgCache(maxsize=2)")
+    eq_(len(cache), 0)
+
+    cache.add(_msg("a"), timestamp=10)
+    cache.add(_msg("b"), timestamp=11)
+    eq_(cache.get("bai/a", 5, now=12), _msg("a"))
+    # 'b' is least recently used
+    cache.add(_msg("c"), timestamp=12)
+    eq_(len(cache), 2)
+    eq_(cache.get("bai/b", 5, now=12), None)
+    eq_(cache.get("bai/a", 5, now=12), _msg("a"))
+    eq_(cache.get("bai/c", 5, now=12), _msg("c"))
+    # too old
+    eq_(cache.get("bai/a", 5, now=15.1), None)
+    # update
+    cache.add(_msg("a"), timestamp=15)
+    eq_(cache.get("bai/a", 5, now=15.1), _msg("a"))
+    eq_(cache.stats, {"hits": 4, "misses": 2, "evictions": 1})
+
+    cache.clear()
+    eq_(len(cache), 0)
+
+    with assert_raises(ValueError):
+        ebus.MsgCache(maxsize=0)
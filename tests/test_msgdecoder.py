@@ -1,13 +1,14 @@
-import pathlib
 import sys
 
+from nose.tools import assert_raises
 from nose.tools import eq_
 
 import ebus
 
+from .util import TESTDATAPATH
 from .util import cmp_
-
-TESTDATAPATH = pathlib.Path(__file__).parent / "testdata"
+from .util import create_msgdefs
+from .util import load_msgdefs
 
 
 def test_listen0a():
@@ -57,3 +58,92 @@ def _test(deffilepath, basepath, num):
 
     # compare
     cmp_(outfilepath, reffilepath)
+
+
+def test_projection():
+    """Decoding with projection (eager and lazy) equals filtering the decoded message."""
+    _test_projection(TESTDATAPATH / "find0.txt", TESTDATAPATH / "listen0a.txt")
+    _test_projection(TESTDATAPATH / "find0.txt", TESTDATAPATH / "listen0b.txt")
+    _test_projection(TESTDATAPATH / "find1.txt", TESTDATAPATH / "listen1a.txt")
+
+
+def _test_projection(deffilepath, infilepath):
+    msgdefs = ebus.MsgDefs()
+    for line in deffilepath.read_text().splitlines():
+        if line:
+            try:
+                msgdefs.add(ebus.decode_msgdef(line))
+            except ValueError as e:
+                pass
+    decoder = ebus.MsgDecoder(msgdefs)
+    for patterns in ("*/*", "bai/*;*/*/temp*", "*/*/+*", "*/*/+*;*/*/sensor", "cc/*/*time*;*/Status"):
+        msgfilter = ebus.MsgFilter(msgdefs.resolve(patterns.split(";")))
+        for line in infilepath.read_text().splitlines():
+            try:
+                msg = decoder.decode_line(line)
+            except (ebus.UnknownMsgError, ValueError) as err:
+                continue
+            if msg:
+                msg = msgfilter(msg)
+            eq_(decoder.decode_line(line, msgfilter=msgfilter), msg)
+            eq_(decoder.decode_line(line, msgfilter=msgfilter, lazy=True), msg)
+
+
+def test_plans():
+    """Decode plans follow changes of the message definitions."""
+    msgdefs = ebus.MsgDefs()
+    msgdefs.add(ebus.decode_msgdef("r,bai,Status,temp,s,UCH,,°C,"))
+    decoder = ebus.MsgDecoder(msgdefs)
+    eq_(decoder.decode_line("bai Status = 21").fields[0].value, 21)
+    eq_(decoder.decode_line("bai Status = 22").fields[0].value, 22)
+
+    msgdefs.update(create_msgdefs("r,bai,Status,temp,s,D1C,,°C,"))
+    eq_(decoder.decode_line("bai Status = 21.5").fields[0].value, 21.5)
+
+    decoder.msgdefs = create_msgdefs("r,bai,Status,temp,s,UCH,,°C,", "r,bai,Mode,mode,s,STR:*,,,")
+    eq_(decoder.decode_line("bai Status = 21.5").fields[0].value, None)
+    eq_(decoder.decode_line("bai Mode = on").fields[0].value, "on")
+
+
+def test_memo():
+    """Memoized decoding equals plain decoding."""
+    msgdefs = load_msgdefs(TESTDATAPATH / "find0.txt")
+    decoder = ebus.MsgDecoder(msgdefs)
+    memodecoder = ebus.MsgDecoder(msgdefs, memosize=8)
+    eq_(memodecoder.memosize, 8)
+    for _ in range(2):
+        for line in (TESTDATAPATH / "listen0b.txt").read_text().splitlines():
+            try:
+                msg = decoder.decode_line(line)
+            except (ebus.UnknownMsgError, ValueError):
+                continue
+            eq_(memodecoder.decode_line(line), msg)
+    stats = memodecoder.memostats
+    eq_(stats["hits"] > stats["misses"] > 0, True)
+    eq_(all(type_.memoizable for type_ in memodecoder.memos), True)
+    eq_(decoder.memostats, {"hits": 0, "misses": 0, "evictions": 0})
+
+
+def test_decode_value_resolved():
+    """Values of resolved message definitions are decoded via the owning message definition."""
+    msgdefs = create_msgdefs("r,bai,FlowTemp,temp,s,D2C,,°C,,sensor,s,UCH,0=ok;85=circuit;170=cutoff,,")
+    decoder = ebus.MsgDecoder(msgdefs)
+    full = decoder.decode_value(msgdefs.get("bai", "FlowTemp"), "40.12;ok")
+    eq_([field.value for field in full.fields], [40.12, "ok", 40.12])
+    for pattern in ("bai/FlowTemp/+*", "bai/FlowTemp/sensor", "bai/FlowTemp#2"):
+        submsgdef = list(msgdefs.resolve([pattern]))[0]
+        msg = decoder.decode_value(submsgdef, "40.12;ok")
+        eq_(msg, ebus.MsgFilter((submsgdef,))(full))
+        eq_(msg.msgdef, submsgdef)
+        eq_(decoder.decode_value(submsgdef, "40.12;ok", lazy=True), msg)
+
+
+def test_parse_line():
+    """Lines are split into message definition and value string."""
+    msgdefs = create_msgdefs("r,bai,Status,temp,s,UCH,,°C,")
+    decoder = ebus.MsgDecoder(msgdefs)
+    eq_(decoder.parse_line("bai Status = 40 "), (msgdefs.get("bai", "Status"), "40"))
+    eq_(decoder.parse_line("bai Status = no data stored"), (msgdefs.get("bai", "Status"), None))
+    eq_(decoder.parse_line("bai Status = ERR: timeout"), (msgdefs.get("bai", "Status"), None))
+    assert_raises(ebus.UnknownMsgError, decoder.parse_line, "bai Unknown = 40")
+    assert_raises(ValueError, decoder.parse_line, "garbage")
@@ -1,5 +1,8 @@
+import copy
+import pickle
 import sys
 
+from nose.tools import assert_raises
 from nose.tools import eq_
 
 import ebus
@@ -7,6 +10,12 @@ import ebus
 _TYPE = ebus.types.StrType(length=2)
 
 
+def _slotsize(num):
+    """Size of an object with `num` slots and nothing else."""
+    cls = type("Slots", (), {"__slots__": tuple(f"slot{idx}" for idx in range(num))})
+    return sys.getsizeof(cls())
+
+
 def test_msgdef0():
     """MsgDef Example 0"""
     m = ebus.MsgDef("circuit", "name", (), True, 5, False, False)
@@ -19,7 +28,8 @@ def test_msgdef0():
     eq_(m.children, ())
     eq_(m.type_, "r5--")
     eq_(m.ident, "circuit/name")
-    eq_(sys.getsizeof(m), 104)
+    eq_(sys.getsizeof(m), _slotsize(12))
+    eq_(hasattr(m, "__dict__"), False)
     eq_(
         repr(m), "MsgDef('circuit', 'name', (), read=True, prio=5)",
     )
@@ -37,7 +47,8 @@ def test_msgdef1():
     eq_(m.children, ())
     eq_(m.type_, "--w-")
     eq_(m.ident, "circuit/name")
-    eq_(sys.getsizeof(m), 104)
+    eq_(sys.getsizeof(m), _slotsize(12))
+    eq_(hasattr(m, "__dict__"), False)
     eq_(
         repr(m), "MsgDef('circuit', 'name', (), write=True)",
     )
@@ -55,7 +66,8 @@ def test_msgdef2():
     eq_(m.children, ())
     eq_(m.type_, "---u")
     eq_(m.ident, "circuit/name")
-    eq_(sys.getsizeof(m), 104)
+    eq_(sys.getsizeof(m), _slotsize(12))
+    eq_(hasattr(m, "__dict__"), False)
     eq_(
         repr(m), "MsgDef('circuit', 'name', (), update=True)",
     )
@@ -69,7 +81,8 @@ def test_fielddef0():
     eq_(f.type_, _TYPE)
     eq_(f.unit, "unit")
     eq_(f.ident, "circuit/name/name")
-    eq_(sys.getsizeof(f), 96)
+    eq_(sys.getsizeof(f), _slotsize(7))
+    eq_(hasattr(f, "__dict__"), False)
     eq_(
         repr(f), "FieldDef(0, 'name', StrType(length=2), unit='unit')",
     )
@@ -97,3 +110,64 @@ def test_hash():
     f0 = ebus.FieldDef(0, "name", _TYPE, "unit")
     f1 = ebus.FieldDef(0, "name", _TYPE, "unit")
     eq_(hash(f0), hash(f1))
+
+
+def test_share():
+    """Fields are shared and keep their first message definition as parent."""
+    f = ebus.FieldDef(0, "name", _TYPE, "unit")
+    m = ebus.MsgDef("circuit", "name", (f,), read=True)
+    n = ebus.MsgDef("circuit", "name", (f,), read=True, prio=2)
+    eq_(f.parent, m)
+    eq_(n.children[0] is f, True)
+    eq_(f.parent is m, True)
+
+    # joining never modifies fields in use
+    j = m.join(ebus.MsgDef("circuit", "name", (ebus.FieldDef(0, "name", _TYPE, "unit"),), write=True))
+    eq_(j.type_, "r-w-")
+    eq_(j.children, (f,))
+    eq_(j.children[0] is f, False)
+    eq_(j.children[0].msgdef is j, True)
+    eq_(f.msgdef is m, True)
+
+    c = copy.copy(f)
+    eq_(c, f)
+    eq_(c.parent, None)
+
+
+def test_immutable():
+    """Message and field definitions are immutable."""
+    f = ebus.FieldDef(0, "name", _TYPE, "unit")
+    v = ebus.msgdef.VirtFieldDef("virt", _TYPE, _virtfunc)
+    m = ebus.MsgDef("circuit", "name", (f, v), read=True)
+    for obj, name in ((m, "read"), (m, "name"), (m, "_hash"), (f, "name"), (f, "_parent"), (v, "func")):
+        assert_raises(AttributeError, setattr, obj, name, None)
+        assert_raises(AttributeError, delattr, obj, name)
+    eq_(m.read, True)
+    eq_(f.name, "name")
+    eq_(f.parent is m, True)
+    eq_(m, ebus.MsgDef("circuit", "name", (f, v), read=True))
+
+
+def _virtfunc(msg):
+    return None
+
+
+def test_cached():
+    """Derived attributes are calculated once."""
+    f = ebus.FieldDef(0, "name", _TYPE, "unit")
+    v = ebus.msgdef.VirtFieldDef("virt", _TYPE, _virtfunc)
+    m = ebus.MsgDef("circuit", "name", (f,), read=True, prio=2)
+    n = ebus.MsgDef("circuit", "name", (f, v), read=True, prio=2)
+    eq_(m.fields is m.children, True)
+    eq_(m.fields is m.fields, True)
+    eq_(m.virtfields, ())
+    eq_(n.fields, (f,))
+    eq_(n.virtfields, (v,))
+    eq_(m.ident is m.ident, True)
+    eq_(m.type_, "r2--")
+    eq_(m.type_ is n.type_, True)
+    eq_(m == n, False)
+
+    p = pickle.loads(pickle.dumps(n))
+    eq_(p, n)
+    eq_(hash(p), hash(n))
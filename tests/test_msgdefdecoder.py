@@ -1,11 +1,10 @@
-import pathlib
+from nose.tools import eq_
 
 import ebus
 
+from .util import TESTDATAPATH
 from .util import cmp_
 
-TESTDATAPATH = pathlib.Path(__file__).parent / "testdata"
-
 
 def test_find0():
     """Process `find0.txt`."""
@@ -42,3 +41,24 @@ def _test(basepath):
                 except ValueError as e:
                     outfile.write(f"{e}\n")
     cmp_(outfilepath, reffilepath)
+
+
+def test_decode_msgdefs():
+    """Bulk decoding equals decoding line by line and shares types."""
+    for filepath in (TESTDATAPATH / "find0.txt", TESTDATAPATH / "find1.txt"):
+        lines = filepath.read_text().splitlines()
+        msgdefs = ebus.decode_msgdefs(lines)
+        eq_(len(msgdefs), len(lines))
+        for line, msgdef in zip(lines, msgdefs):
+            try:
+                eq_(msgdef, ebus.decode_msgdef(line))
+            except ValueError:
+                eq_(msgdef, None)
+    msgdef0, msgdef1 = ebus.decode_msgdefs(["r,bai,Temp0,temp,s,D2C,,°C,", "r,bai,Temp1,temp,s,D2C,,°C,"])
+    assert msgdef0.fields[0].type_ is msgdef1.fields[0].type_
+
+
+def test_split():
+    """Fast split equals regular expression split."""
+    for line in ("a,b,c,", "a,b,c", "a,,c,,", ",", "", "a"):
+        eq_(ebus.msgdefdecoder._split(line), [m[1] or m[2] for m in ebus.msgdefdecoder._RE_SPLIT.findall(line)])
@@ -1,4 +1,5 @@
-import pathlib
+import concurrent.futures
+import pickle
 
 from nose.tools import assert_raises
 from nose.tools import eq_
@@ -9,9 +10,9 @@ from ebus import MsgDef
 from ebus.types import IntType
 from ebus.types import TimeType
 
+from .util import TESTDATAPATH
 from .util import cmp_
-
-TESTDATAPATH = pathlib.Path(__file__).parent / "testdata"
+from .util import load_msgdefs
 
 
 def test_msgdefs0():
@@ -73,9 +74,9 @@ def test_msgdefs0():
                 "mc.5",
                 "Timer.Friday",
                 (
-                    FieldDef(1, "to.0", TimeType(minres=10)),
-                    FieldDef(3, "to.1", TimeType(minres=10)),
-                    FieldDef(5, "to.2", TimeType(minres=10)),
+                    FieldDef(1, "to.0", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(3, "to.1", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(5, "to.2", TimeType(minres=10, nosecond=True), comment="bis"),
                 ),
                 read=True,
                 write=True,
@@ -84,9 +85,9 @@ def test_msgdefs0():
                 "mc.5",
                 "Timer.Monday",
                 (
-                    FieldDef(1, "to.0", TimeType(minres=10)),
-                    FieldDef(3, "to.1", TimeType(minres=10)),
-                    FieldDef(5, "to.2", TimeType(minres=10)),
+                    FieldDef(1, "to.0", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(3, "to.1", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(5, "to.2", TimeType(minres=10, nosecond=True), comment="bis"),
                 ),
                 read=True,
                 write=True,
@@ -95,9 +96,9 @@ def test_msgdefs0():
                 "mc.5",
                 "Timer.Saturday",
                 (
-                    FieldDef(1, "to.0", TimeType(minres=10)),
-                    FieldDef(3, "to.1", TimeType(minres=10)),
-                    FieldDef(5, "to.2", TimeType(minres=10)),
+                    FieldDef(1, "to.0", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(3, "to.1", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(5, "to.2", TimeType(minres=10, nosecond=True), comment="bis"),
                 ),
                 read=True,
                 write=True,
@@ -106,9 +107,9 @@ def test_msgdefs0():
                 "mc.5",
                 "Timer.Sunday",
                 (
-                    FieldDef(1, "to.0", TimeType(minres=10)),
-                    FieldDef(3, "to.1", TimeType(minres=10)),
-                    FieldDef(5, "to.2", TimeType(minres=10)),
+                    FieldDef(1, "to.0", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(3, "to.1", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(5, "to.2", TimeType(minres=10, nosecond=True), comment="bis"),
                 ),
                 read=True,
                 write=True,
@@ -117,9 +118,9 @@ def test_msgdefs0():
                 "mc.5",
                 "Timer.Thursday",
                 (
-                    FieldDef(1, "to.0", TimeType(minres=10)),
-                    FieldDef(3, "to.1", TimeType(minres=10)),
-                    FieldDef(5, "to.2", TimeType(minres=10)),
+                    FieldDef(1, "to.0", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(3, "to.1", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(5, "to.2", TimeType(minres=10, nosecond=True), comment="bis"),
                 ),
                 read=True,
                 write=True,
@@ -128,9 +129,9 @@ def test_msgdefs0():
                 "mc.5",
                 "Timer.Tuesday",
                 (
-                    FieldDef(1, "to.0", TimeType(minres=10)),
-                    FieldDef(3, "to.1", TimeType(minres=10)),
-                    FieldDef(5, "to.2", TimeType(minres=10)),
+                    FieldDef(1, "to.0", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(3, "to.1", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(5, "to.2", TimeType(minres=10, nosecond=True), comment="bis"),
                 ),
                 read=True,
                 write=True,
@@ -139,9 +140,9 @@ def test_msgdefs0():
                 "mc.5",
                 "Timer.Wednesday",
                 (
-                    FieldDef(1, "to.0", TimeType(minres=10)),
-                    FieldDef(3, "to.1", TimeType(minres=10)),
-                    FieldDef(5, "to.2", TimeType(minres=10)),
+                    FieldDef(1, "to.0", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(3, "to.1", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(5, "to.2", TimeType(minres=10, nosecond=True), comment="bis"),
                 ),
                 read=True,
                 write=True,
@@ -155,9 +156,9 @@ def test_msgdefs0():
                 "mc.5",
                 "Timer.Friday",
                 (
-                    FieldDef(1, "to.0", TimeType(minres=10)),
-                    FieldDef(3, "to.1", TimeType(minres=10)),
-                    FieldDef(5, "to.2", TimeType(minres=10)),
+                    FieldDef(1, "to.0", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(3, "to.1", TimeType(minres=10, nosecond=True), comment="bis"),
+                    FieldDef(5, "to.2", TimeType(minres=10, nosecond=True), comment="bis"),
                 ),
                 read=True,
                 prio=3,
@@ -182,3 +183,77 @@ def test_msgdefs1():
 
     eq_(len(msgdefs), 413)
     eq_(msgdefs.summary(), "413 messages (396 read, 12 update, 229 write) with 830 fields")
+
+
+def test_msgdefs_index():
+    """Indexed Lookup."""
+    msgdefs = ebus.MsgDefs()
+    infilepath = TESTDATAPATH / "find0.txt"
+    for line in infilepath.read_text().splitlines():
+        if line:
+            try:
+                msgdefs.add(ebus.decode_msgdef(line))
+            except ValueError as e:
+                pass
+
+    statpoweron = MsgDef("cc", "StatPowerOn", (FieldDef(0, "", IntType(0, 65534)),), read=True)
+    eq_(statpoweron in msgdefs, True)
+    eq_(MsgDef("cc", "StatPowerOn", (), read=True) in msgdefs, False)
+    eq_(MsgDef("xx", "StatPowerOn", (), read=True) in msgdefs, False)
+
+    eq_([msgdef.ident for msgdef in msgdefs.find("mc.[34]", "Status")], ["mc.3/Status", "mc.4/Status"])
+    eq_([msgdef.ident for msgdef in msgdefs.find("bai", "WaterPressure")], ["bai/WaterPressure"])
+    eq_([msgdef.ident for msgdef in msgdefs.find("bai", "Water")], [])
+    eq_(len(msgdefs.find("*")), len(msgdefs))
+
+    # index follows modifications
+    eq_(len(msgdefs.find("new*")), 0)
+    msgdefs.add(MsgDef("newcircuit", "StatPowerOn", (FieldDef(0, "", IntType(0, 65534)),), read=True))
+    eq_(len(msgdefs.find("new*")), 1)
+    eq_(len(msgdefs.resolve(["new*/*", "newcircuit/Stat*"])), 1)
+
+
+def test_frozen():
+    """Immutable Snapshot."""
+    msgdefs = load_msgdefs(TESTDATAPATH / "find0.txt")
+
+    frozen = msgdefs.freeze()
+    eq_(isinstance(frozen, ebus.FrozenMsgDefs), True)
+    eq_(frozen.freeze() is frozen, True)
+    eq_(frozen.generation, msgdefs.generation)
+    eq_(list(frozen), list(msgdefs))
+    eq_(frozen.summary(), msgdefs.summary())
+    eq_(frozen.get("bai", "WaterPressure") is msgdefs.get("bai", "WaterPressure"), True)
+    eq_(list(frozen.find("mc.[34]", "Status")), list(msgdefs.find("mc.[34]", "Status")))
+    eq_(list(frozen.resolve(["mc.4/*#2/temp*"])), list(msgdefs.resolve(["mc.4/*#2/temp*"])))
+    eq_(msgdefs.get("cc", "StatPowerOn") in frozen, True)
+
+    newmsgdef = MsgDef("newcircuit", "StatPowerOn", (FieldDef(0, "", IntType(0, 65534)),), read=True)
+    assert_raises(TypeError, frozen.add, newmsgdef)
+    assert_raises(TypeError, frozen.clear)
+    assert_raises(TypeError, frozen.update, msgdefs)
+
+    # the snapshot does not follow modifications of its origin
+    msgdefs.add(newmsgdef)
+    eq_(len(frozen), 777)
+    eq_(frozen.get("newcircuit", "StatPowerOn"), None)
+
+    # changes are done on a copy
+    copy = frozen.copy()
+    copy.add(newmsgdef)
+    updated = copy.freeze()
+    eq_(len(updated), 778)
+    eq_(len(frozen), 777)
+    eq_(updated.generation > frozen.generation, True)
+    eq_(copy.update(frozen), (tuple(), (newmsgdef,), tuple()))
+
+    # processes
+    unpickled = pickle.loads(pickle.dumps(frozen))
+    eq_(list(unpickled), list(frozen))
+    eq_(len(unpickled.find("?c")), 132)
+
+    # threads
+    names = [(msgdef.circuit, msgdef.name) for msgdef in frozen]
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        found = list(executor.map(lambda name: frozen.get(*name), names * 4))
+    eq_(found, [frozen.get(*name) for name in names] * 4)
@@ -0,0 +1,84 @@
+import pathlib
+import pickle
+import tempfile
+
+from nose.tools import assert_raises
+from nose.tools import eq_
+
+import ebus
+from ebus.msgdefscache import fingerprint
+
+from .util import TESTDATAPATH
+from .util import DummyServer
+from .util import run
+
+
+def test_msgdefscache():
+    """Store and Load Message Definitions."""
+    lines = [line for line in (TESTDATAPATH / "find0.txt").read_text().splitlines() if line]
+    msgdefs = dict(zip(lines, ebus.decode_msgdefs(lines)))
+    fp = fingerprint(lines)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = ebus.MsgDefsCache(tmpdir)
+        eq_(repr(cache), f"MsgDefsCache({tmpdir!r})")
+        eq_(cache.get_filepath("host", 8888), pathlib.Path(tmpdir) / "msgdefs-host-8888.pickle")
+        eq_(cache.load("host", 8888, fp), None)
+
+        cache.save("host", 8888, fp, msgdefs)
+        loaded = cache.load("host", 8888, fp)
+        eq_(loaded, msgdefs)
+        loadedmsgdefs = [msgdef for msgdef in loaded.values() if msgdef]
+        eq_(all(all(child.parent is msgdef for child in msgdef.children) for msgdef in loadedmsgdefs), True)
+        # virtual fields survive
+        virtmsgdefs = [msgdef for msgdef in loadedmsgdefs if msgdef.virtfields]
+        eq_(len(virtmsgdefs) > 0, True)
+
+        # other fingerprint, host or port
+        eq_(cache.load("host", 8888, fingerprint(lines[1:])), None)
+        eq_(cache.load("other", 8888, fp), None)
+        eq_(cache.load("host", 8889, fp), None)
+
+        # outdated version
+        filepath = cache.get_filepath("host", 8888)
+        with filepath.open("wb") as file:
+            pickle.dump({"version": 0, "fingerprint": fp, "msgdefs": msgdefs}, file)
+        eq_(cache.load("host", 8888, fp), None)
+
+        # broken file
+        filepath.write_bytes(b"broken")
+        eq_(cache.load("host", 8888, fp), None)
+
+        cache.remove("host", 8888)
+        eq_(filepath.exists(), False)
+        cache.remove("host", 8888)
+
+        # failed save leaves no files behind
+        with assert_raises((pickle.PicklingError, AttributeError)):
+            cache.save("host", 8888, fp, {"line": lambda: None})
+        eq_(list(pathlib.Path(tmpdir).iterdir()), [])
+
+
+def test_load_msgdefs():
+    """Load Message Definitions via Cache."""
+    s = DummyServer()
+    find = "r,bai,Status,temp,s,UCH,,°C,\nw,bai,Status,temp,s,UCH,,°C,\nr,mc,Temp,temp,s,UCH,,°C,\n\n"
+
+    async def test():
+        await s.start()
+        for _ in range(2):
+            s.add_rx("find -a -F type,circuit,name,fields\n")
+            s.add_tx(find)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ebus.MsgDefsCache(tmpdir)
+            e = ebus.Ebus(s.LOCALHOST, s.port)
+            await e.load_msgdefs(cache=cache)
+            eq_(e.msgdefs.summary(), "2 messages (2 read, 0 update, 1 write) with 2 fields")
+            eq_(cache.get_filepath(s.LOCALHOST, s.port).exists(), True)
+
+            e = ebus.Ebus(s.LOCALHOST, s.port)
+            await e.load_msgdefs(cache=cache)
+            eq_(e.msgdefs.summary(), "2 messages (2 read, 0 update, 1 write) with 2 fields")
+
+    run(test, server=s)
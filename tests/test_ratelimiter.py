@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+from nose.tools import assert_raises
+from nose.tools import eq_
+
+import ebus
+
+from .util import run
+
+
+def test_ratelimiter():
+    """Rate Limiter Properties."""
+    r = ebus.RateLimiter()
+    eq_(repr(r), "RateLimiter()")
+    r = ebus.RateLimiter(rate=5, burst=2, rates={"bai": 0.5})
+    eq_(repr(r), "RateLimiter(rate=5, burst=2, rates={'bai': 0.5})")
+    eq_(r.get_rate("bai"), 0.5)
+    eq_(r.get_rate("mc"), 5)
+
+    with assert_raises(ValueError):
+        ebus.RateLimiter(rate=0)
+    with assert_raises(ValueError):
+        ebus.RateLimiter(burst=0)
+
+
+def test_acquire():
+    """Urgent requests are preferred."""
+    r = ebus.RateLimiter(rate=100)
+    order = []
+
+    async def acquire(name, circuit="bai", urgent=False):
+        await r.acquire(circuit, urgent=urgent)
+        order.append(name)
+
+    async def test():
+        start = time.monotonic()
+        tasks = [asyncio.ensure_future(acquire(f"read{idx}")) for idx in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.ensure_future(acquire("write", urgent=True)))
+        tasks.append(asyncio.ensure_future(acquire("other", circuit="mc")))
+        await asyncio.gather(*tasks)
+        eq_(order, ["read0", "other", "write", "read1", "read2"])
+        eq_(time.monotonic() - start >= 0.029, True)
+        eq_(r.stats["requests"], 5)
+        eq_(r.stats["delayed"], 3)
+        eq_(r.stats["waittime"] > 0, True)
+        eq_(r.stats["maxwaittime"] >= 0.029, True)
+
+    run(test)
+
+
+def test_cancel():
+    """Cancelled requests do not consume budget."""
+    r = ebus.RateLimiter(rate=100)
+
+    async def test():
+        await r.acquire("bai")
+        task = asyncio.ensure_future(r.acquire("bai"))
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.sleep(0.015)
+        start = time.monotonic()
+        await r.acquire("bai")
+        eq_(time.monotonic() - start < 0.005, True)
+
+    run(test)
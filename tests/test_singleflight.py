@@ -0,0 +1,68 @@
+import asyncio
+
+from nose.tools import assert_raises
+from nose.tools import eq_
+
+import ebus
+
+from .util import run
+
+
+def test_singleflight():
+    """Concurrent calls are coalesced."""
+    s = ebus.SingleFlight()
+    calls = []
+
+    async def func(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    async def test():
+        results = await asyncio.gather(s.call("a", func, 1), s.call("a", func, 1), s.call("b", func, 2))
+        eq_(results, [2, 2, 4])
+        eq_(calls, [1, 2])
+        eq_(s.stats, {"calls": 2, "coalesced": 1})
+        eq_(len(s), 0)
+        # sequential calls are not coalesced
+        eq_(await s.call("a", func, 1), 2)
+        eq_(calls, [1, 2, 1])
+        eq_(s.stats, {"calls": 3, "coalesced": 1})
+
+    run(test)
+
+
+def test_singleflight_error():
+    """Errors are propagated to all callers."""
+    s = ebus.SingleFlight()
+
+    async def func():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def test():
+        results = await asyncio.gather(s.call("a", func), s.call("a", func), return_exceptions=True)
+        eq_([repr(result) for result in results], ["ValueError('boom')", "ValueError('boom')"])
+        eq_(s.stats, {"calls": 1, "coalesced": 1})
+
+    run(test)
+
+
+def test_singleflight_cancel():
+    """Cancelling one caller does not cancel the call."""
+    s = ebus.SingleFlight()
+
+    async def func():
+        await asyncio.sleep(0.01)
+        return 5
+
+    async def test():
+        first = asyncio.ensure_future(s.call("a", func))
+        second = asyncio.ensure_future(s.call("a", func))
+        await asyncio.sleep(0.001)
+        first.cancel()
+        eq_(await second, 5)
+        with assert_raises(asyncio.CancelledError):
+            await first
+
+    run(test)
@@ -0,0 +1,79 @@
+import datetime
+import pickle
+
+from nose.tools import eq_
+
+import ebus
+
+
+def _strptime(value, format_):
+    try:
+        return datetime.datetime.strptime(value, format_)
+    except ValueError:
+        return None
+
+
+def _values(*ranges):
+    """All combinations of numbers in `ranges` with and without leading zero."""
+    if ranges:
+        for head in ranges[0]:
+            for tail in _values(*ranges[1:]):
+                for headstr in sorted({str(head), f"{head:02d}"}):
+                    yield (headstr,) + tail
+    else:
+        yield ()
+
+
+_INVALID = ("", "-", "-.-.-", "-:-:-", "-:-", "1", "1.2.", "12:", "12:30:", " 12:30", "12:30 ", "a:b", "1.1.20")
+
+
+def test_date():
+    """Date decoding is equivalent to `strptime`."""
+    values = [".".join(item) for item in _values(range(33), range(14), (1900, 2000, 2020, 2021))]
+    values += [" 1.1.2020", "01.01.02020", "001.01.2020", "29.02.2019", "29.02.2020", *_INVALID]
+    for type_ in set(ebus.types.TYPEMAP[name] for name in ("BDA", "BDA:3", "HDA", "HDA:3")):
+        for decoder in (type_.decode, type_.get_decoder()):
+            for value in values:
+                dt = _strptime(value, "%d.%m.%Y")
+                eq_(decoder(value), dt.date() if dt else None, value)
+
+
+def test_time():
+    """Time decoding is equivalent to `strptime`."""
+    values = [":".join(item) for item in _values(range(26), (0, 1, 9, 10, 59, 60), range(63))]
+    values += ["001:00:00", "00:001:00", "00:00:001", *_INVALID]
+    type_ = ebus.types.TYPEMAP["BTI"]
+    for decoder in (type_.decode, type_.get_decoder()):
+        for value in values:
+            dt = _strptime(value, "%H:%M:%S")
+            eq_(decoder(value), ebus.types.ShortTime(dt.hour, dt.minute, dt.second) if dt else None, value)
+
+
+def test_shorttime():
+    """Short time decoding is equivalent to `strptime`."""
+    values = [":".join(item) for item in _values(range(26), range(62))]
+    values += ["001:00", "00:001", "12:30:00", *_INVALID]
+    type_ = ebus.types.TYPEMAP["BTM"]
+    for decoder in (type_.decode, type_.get_decoder()):
+        for value in values:
+            dt = _strptime(value, "%H:%M")
+            eq_(decoder(value), ebus.types.ShortTime(dt.hour, dt.minute) if dt else None, value)
+
+
+def test_hash():
+    """Hash is calculated once and not pickled."""
+    type_ = ebus.types.IntType(0, 100, divider=10)
+    eq_(hash(type_), hash(ebus.types.IntType(0, 100, divider=10)))
+    eq_(type_._hash, hash(type_))
+    eq_("_hash" in type_.__getstate__(), False)
+    eq_(pickle.loads(pickle.dumps(type_)), type_)
+    eq_(type_ == ebus.types.IntType(0, 100, divider=5), False)
+
+
+def test_intern():
+    """Equal types share one instance."""
+    type_ = ebus.types.intern_type(ebus.types.EnumType(("off", "on")))
+    eq_(ebus.types.intern_type(ebus.types.EnumType(("off", "on"))) is type_, True)
+    eq_(pickle.loads(pickle.dumps(ebus.types.EnumType(("off", "on")))) is type_, True)
+    eq_(ebus.types.gettype("UCH", 10) is ebus.types.gettype("UCH", 10), True)
+    eq_(ebus.types.gettype("UCH", 10) is ebus.types.gettype("UCH", 5), False)
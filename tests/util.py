@@ -2,12 +2,37 @@ import asyncio
 import collections
 import filecmp
 import os
+import pathlib
 import shutil
 
 from nose.tools import eq_
 
+import ebus
+
 _LEARN = False
 
+TESTDATAPATH = pathlib.Path(__file__).parent / "testdata"
+
+
+def create_msgdefs(*lines):
+    """Create :any:`MsgDefs` from message definition `lines`."""
+    msgdefs = ebus.MsgDefs()
+    for line in lines:
+        msgdefs.add(ebus.decode_msgdef(line))
+    return msgdefs
+
+
+def load_msgdefs(filepath):
+    """Load :any:`MsgDefs` with all valid message definitions from `filepath`."""
+    msgdefs = ebus.MsgDefs()
+    for line in filepath.read_text().splitlines():
+        if line:
+            try:
+                msgdefs.add(ebus.decode_msgdef(line))
+            except ValueError:
+                pass
+    return msgdefs
+
 
 def cmp_(out, ref):
     """Compare files."""